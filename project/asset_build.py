@@ -0,0 +1,174 @@
+# asset_build.py
+# Zet de PNG's in assets/ om naar een formaat dat snel te laden is (python asset_build.py).
+
+# Per afbeelding één .rgba-bestand in BUILD_DIR: korte header + ruwe RGBA pixels (optioneel zlib),
+# dus laden = lezen + frombuffer, zonder PNG-decode
+
+# Plus verkleinde varianten (naam@2.rgba, naam@4.rgba, zie BUILD_MIP_LEVELS); built_surface()
+# met een target kiest de kleinste variant die nog minstens zo groot is als het doel
+
+# manifest.json onthoudt per bronbestand de grootte/mtime, de sha1 en het verwachte
+# build-bestand; built_surface() controleert alleen die metadata (os.stat), geen hele bestanden
+
+# Verouderde of ontbrekende build-bestanden worden gewoon overgeslagen (dan wordt de PNG geladen)
+import hashlib
+import json
+import os
+import struct
+import sys
+import zlib
+import pygame
+from config import ASSETS_DIR, BUILD_DIR, BUILD_COMPRESS, BUILD_MIP_LEVELS
+
+BUILD_MAGIC = b"OGA1"
+BUILD_HEADER = struct.Struct(">4sIIB3x")   # magic, w, h, flags
+FLAG_ZLIB = 1
+FLAG_OPAQUE = 2
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 2
+MIP_MIN_SIZE = 32   # kleinere varianten dan dit worden niet gemaakt
+
+_manifest = None
+
+def built_name(filename, level=1):
+    base = os.path.splitext(filename)[0]
+    return f"{base}.rgba" if level == 1 else f"{base}@{level}.rgba"
+
+def _manifest_entries():
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(os.path.join(BUILD_DIR, MANIFEST_NAME), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            _manifest = data["files"] if data.get("version") == MANIFEST_VERSION else {}
+        except Exception:
+            _manifest = {}
+    return _manifest
+
+def _variant(entry, level):
+    return entry if level == 1 else entry.get("variants", {}).get(str(level))
+
+def pick_level(filename, target=None):
+    # kleinste variant die target (w, h) nog helemaal dekt; zonder target de volle resolutie
+    entry = _manifest_entries().get(filename)
+    if entry is None or target is None:
+        return 1
+    tw, th = target
+    for level in sorted((int(l) for l in entry.get("variants", {})), reverse=True):
+        variant = _variant(entry, level)
+        if variant["w"] >= tw and variant["h"] >= th:
+            return level
+    return 1
+
+def built_path(filename, level=1):
+    # pad van een geldig build-bestand, of None (geen build, bron aangepast, build kapot)
+    entry = _manifest_entries().get(filename)
+    variant = _variant(entry, level) if entry is not None else None
+    if variant is None:
+        return None
+    path = os.path.join(BUILD_DIR, variant["built"])
+    try:
+        src = os.stat(os.path.join(ASSETS_DIR, filename))
+        built = os.stat(path)
+    except OSError:
+        return None
+    if (src.st_size, src.st_mtime_ns) != (entry["source_size"], entry["source_mtime_ns"]):
+        return None
+    if built.st_size != variant["built_size"]:
+        return None
+    return path
+
+def check_build():
+    # startup-check: (geldige, verouderde) bestanden volgens het manifest
+    ok = sum(1 for filename in _manifest_entries() if built_path(filename) is not None)
+    return ok, len(_manifest_entries()) - ok
+
+def read_built(path):
+    # Surface zonder convert (werkt ook zonder display, bv. in decode_pool); opake
+    # afbeeldingen krijgen geen alpha-kanaal
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, w, h, flags = BUILD_HEADER.unpack_from(data)
+    if magic != BUILD_MAGIC:
+        raise ValueError(f"geen build-bestand: {path}")
+    pixels = data[BUILD_HEADER.size:]
+    if flags & FLAG_ZLIB:
+        pixels = zlib.decompress(pixels)
+    if len(pixels) != w * h * 4:
+        raise ValueError(f"build-bestand kapot: {path}")
+    return pygame.image.frombuffer(pixels, (w, h), "RGBX" if flags & FLAG_OPAQUE else "RGBA")
+
+def built_surface(filename, target=None):
+    path = built_path(filename, pick_level(filename, target))
+    if path is None and target is not None:
+        path = built_path(filename)
+    if path is None:
+        return None
+    try:
+        return read_built(path)
+    except Exception:
+        return None
+
+def write_built(path, surf, compress=BUILD_COMPRESS):
+    w, h = surf.get_size()
+    pixels = pygame.image.tobytes(surf, "RGBA")
+    opaque = not surf.get_flags() & pygame.SRCALPHA or min(pixels[3::4]) == 255
+    flags = FLAG_OPAQUE if opaque else 0
+    if compress:
+        pixels = zlib.compress(pixels, 1)
+        flags |= FLAG_ZLIB
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(BUILD_HEADER.pack(BUILD_MAGIC, w, h, flags))
+        f.write(pixels)
+    os.replace(tmp, path)
+    return {"w": w, "h": h, "opaque": bool(opaque), "built_size": os.path.getsize(path)}
+
+def _sha1(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def build_all(force=False):
+    os.makedirs(BUILD_DIR, exist_ok=True)
+    old = _manifest_entries()
+    files = {}
+    for filename in sorted(os.listdir(ASSETS_DIR)):
+        src_path = os.path.join(ASSETS_DIR, filename)
+        if not filename.lower().endswith(".png") or not os.path.isfile(src_path):
+            continue
+        if not force and built_path(filename) is not None:
+            files[filename] = old[filename]
+            continue
+        st = os.stat(src_path)
+        entry = {"source_size": st.st_size, "source_mtime_ns": st.st_mtime_ns,
+                 "sha1": _sha1(src_path), "built": built_name(filename)}
+        surf = pygame.image.load(src_path)
+        entry.update(write_built(os.path.join(BUILD_DIR, entry["built"]), surf))
+        entry["variants"] = {}
+        for level in BUILD_MIP_LEVELS:
+            w, h = entry["w"] // level, entry["h"] // level
+            if min(w, h) < MIP_MIN_SIZE:
+                continue
+            variant = {"built": built_name(filename, level)}
+            variant.update(write_built(os.path.join(BUILD_DIR, variant["built"]),
+                                       pygame.transform.smoothscale(surf, (w, h))))
+            entry["variants"][str(level)] = variant
+        files[filename] = entry
+        levels = "".join(f" @{level}" for level in entry["variants"])
+        print(f"  {filename} -> {entry['built']} ({entry['w']}x{entry['h']}){levels}")
+
+    tmp = os.path.join(BUILD_DIR, MANIFEST_NAME + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"version": MANIFEST_VERSION, "files": files}, f, indent=2)
+    os.replace(tmp, os.path.join(BUILD_DIR, MANIFEST_NAME))
+
+    global _manifest
+    _manifest = files
+    return files
+
+if __name__ == "__main__":
+    files = build_all(force="--force" in sys.argv)
+    print(f"{len(files)} afbeeldingen in {BUILD_DIR}")
@@ -1,62 +1,55 @@
 # assets.py
 # Laadt alle afbeeldingen (en flags voor optionele backgrounds).
 
-# load_images() geeft een dict terug met alle images
+# load_images() geeft een SurfaceRegistry terug (werkt als dict, decodeert lazy)
 
-# boss_asset_for_level() kiest boss sprite op basis van level
+# boss_asset_for_level() kiest boss sprite op basis van level, boss_size() de grootte
 import pygame
-from utils import load_image, scale
+from surface_registry import SurfaceRegistry
 
 def load_images():
-    img = {}
+    # Alleen registreren: de PNG's worden pas gedecodeerd als ze gebruikt worden
+    img = SurfaceRegistry()
 
-    img["background"] = load_image("Background.png")
-    img["desk"] = load_image("desk.png")
+    img.register("background", "Background.png")
+    img.register("desk", "desk.png")
 
-    img["boss_1"] = load_image("boss_lvl1.png")
-    img["boss_2"] = load_image("boss_lvl2.png")
-    img["boss_3"] = load_image("boss_lvl3.png")
+    img.register("boss_1", "boss_lvl1.png")
+    img.register("boss_2", "boss_lvl2.png")
+    img.register("boss_3", "boss_lvl3.png")
 
-    img["hands_0"] = load_image("hands1.png")
-    img["hands_1"] = load_image("hands2.png")
-    img["smoking_hand"] = load_image("Smoking.png")
+    img.register("hands_0", "hands1.png", trim=True)
+    img.register("hands_1", "hands2.png", trim=True)
+    img.register("smoking_hand", "Smoking.png", trim=True)
 
-    img["phone_default"] = load_image("phone.png")
+    img.register("phone_default", "phone.png", trim=True)
 
     # Optional backgrounds
-    try:
-        img["main_menu_bg"] = load_image("main_menu_bg.png")
-        img["HAS_MENU_BG"] = True
-    except Exception:
-        img["main_menu_bg"] = None
-        img["HAS_MENU_BG"] = False
-
-    try:
-        img["caught_bg"] = load_image("caught_bg.png")
-        img["HAS_CAUGHT_BG"] = True
-    except Exception:
-        img["caught_bg"] = None
-        img["HAS_CAUGHT_BG"] = False
-
-    try:
-        img["level_select_bg"] = load_image("office_building.png")
-        img["HAS_LEVEL_SELECT_BG"] = True
-    except Exception:
-        img["level_select_bg"] = None
-        img["HAS_LEVEL_SELECT_BG"] = False
-        # assets.py (in load_images())
-    try:
-        img["complete_bg"] = load_image("lvl_complete_scene.png")
-        img["HAS_COMPLETE_BG"] = True
-    except Exception:
-        img["complete_bg"] = None
-        img["HAS_COMPLETE_BG"] = False
+    img["HAS_MENU_BG"] = img.register("main_menu_bg", "main_menu_bg.png", optional=True)
+    img["HAS_CAUGHT_BG"] = img.register("caught_bg", "caught_bg.png", optional=True)
+    img["HAS_LEVEL_SELECT_BG"] = img.register("level_select_bg", "office_building.png", optional=True)
+    img["HAS_COMPLETE_BG"] = img.register("complete_bg", "lvl_complete_scene.png", optional=True)
 
     return img
 
-def boss_asset_for_level(img, level_num: int) -> pygame.Surface:
+# een level uit elke boss-groep (1-4, 5-9, 10+), voor de play-atlas
+BOSS_LEVELS = (1, 5, 10)
+
+def boss_key_for_level(level_num: int) -> str:
     if level_num >= 10:
-        return img["boss_3"]
+        return "boss_3"
+    if level_num >= 5:
+        return "boss_2"
+    return "boss_1"
+
+def boss_asset_for_level(img, level_num: int) -> pygame.Surface:
+    return img[boss_key_for_level(level_num)]
+
+def boss_size(layout, level_num: int, t: float):
+    # t = 0 (ver weg) .. 1 (dichtbij); vanaf level 5 is de baas groter
+    bw = int(layout["BOSS_FAR"][0] + (layout["BOSS_NEAR"][0] - layout["BOSS_FAR"][0]) * t)
+    bh = int(layout["BOSS_FAR"][1] + (layout["BOSS_NEAR"][1] - layout["BOSS_FAR"][1]) * t)
     if level_num >= 5:
-        return img["boss_2"]
-    return img["boss_1"]
+        bw = int(bw * 1.25)
+        bh = int(bh * 1.25)
+    return bw, bh
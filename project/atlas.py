@@ -0,0 +1,90 @@
+# atlas.py
+# Texture-atlas: veel kleine sprites samen op één grote surface.
+
+# Atlas pakt sprites in rijen ("shelves"): zo ver mogelijk naar rechts, dan een nieuwe rij
+# onder de hoogste sprite van de vorige; per naam onthoudt hij de rect (+ de offset van een
+# TrimmedSurface, zodat blitten hetzelfde werkt als blit_sprite)
+
+# build_atlas() maakt in één keer een atlas die precies groot genoeg is (grootste sprites eerst);
+# Atlas(size) + add() vult een vaste surface stap voor stap (add() geeft False als hij vol is)
+
+# blit() / blits() tekenen sub-rects uit de atlas (blits = één Surface.blits call)
+import pygame
+from config import ATLAS_MAX_WIDTH
+from sprites import sprite_offset
+
+class Atlas:
+    def __init__(self, size, padding=1):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        self.padding = padding
+        self.entries = {}   # naam -> (Rect in de atlas, offset)
+        self._x = self._y = self._shelf_h = 0
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def _place(self, w, h):
+        width, height = self.surface.get_size()
+        if self._x + w > width:
+            self._x = 0
+            self._y += self._shelf_h + self.padding
+            self._shelf_h = 0
+        if self._x + w > width or self._y + h > height:
+            return None
+        pos = (self._x, self._y)
+        self._x += w + self.padding
+        self._shelf_h = max(self._shelf_h, h)
+        return pos
+
+    def add(self, name, surf):
+        # geeft False als de atlas vol is
+        w, h = surf.get_size()
+        pos = self._place(w, h)
+        if pos is None:
+            return False
+        offset = sprite_offset(surf)
+        if surf.get_colorkey() is not None:
+            # BLEND_RGBA_MAX negeert de colorkey; eerst naar per-pixel alpha (key -> alpha 0)
+            surf = surf.convert_alpha()
+        # MAX op de lege atlas = exacte kopie van de pixels (inclusief alpha)
+        self.surface.blit(surf, pos, special_flags=pygame.BLEND_RGBA_MAX)
+        self.entries[name] = (pygame.Rect(pos, (w, h)), offset)
+        return True
+
+    def rect(self, name):
+        return self.entries[name][0]
+
+    def blit(self, target, name, pos):
+        area, (ox, oy) = self.entries[name]
+        return target.blit(self.surface, (pos[0] + ox, pos[1] + oy), area)
+
+    def blits(self, target, items):
+        # items: [(naam, pos), ...] -> één Surface.blits call
+        seq = []
+        for name, pos in items:
+            area, (ox, oy) = self.entries[name]
+            seq.append((self.surface, (pos[0] + ox, pos[1] + oy), area))
+        target.blits(seq, doreturn=False)
+
+def _shelf_height(sizes, width, padding):
+    x = y = shelf_h = 0
+    for w, h in sizes:
+        if x + w > width:
+            x = 0
+            y += shelf_h + padding
+            shelf_h = 0
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+    return max(1, y + shelf_h)
+
+def build_atlas(surfaces, max_width=ATLAS_MAX_WIDTH, padding=1):
+    # surfaces: dict naam -> Surface (None wordt overgeslagen)
+    items = sorted(((name, s) for name, s in surfaces.items() if s is not None),
+                   key=lambda item: item[1].get_height(), reverse=True)
+    sizes = [s.get_size() for _, s in items]
+    total_w = sum(w + padding for w, _ in sizes)
+    width = max(min(max_width, total_w), max((w for w, _ in sizes), default=1))
+    atlas = Atlas((width, _shelf_height(sizes, width, padding)), padding)
+    for name, surf in items:
+        atlas.add(name, surf)
+    return atlas
@@ -3,12 +3,35 @@
 
 # safe_sound() voorkomt crash als een mp3/wav ontbreekt
 
-# load_sounds() geeft een dict met sounds terug
+# load_sounds() geeft een dict met sounds terug; er wordt bij het opstarten niets gedecodeerd:
+# - korte SFX zijn LazySound: decoderen bij de eerste play(), PCM zit in de SoundBank (LRU)
+# - lange tracks (>= AUDIO_STREAM_MIN_BYTES) zijn StreamedSound: via pygame.mixer.music
+#   gestreamd van schijf (er kan maar één stream tegelijk spelen)
 
-# stop_all_loop_sounds() stopt loopende sounds bij scene switch
+# LoopChannels: elke loop-rol (typen, telefoon, voetstappen, gebabbel) heeft een eigen
+# gereserveerd mixer-kanaal; play() van wat al speelt doet niets, stop() van typen/telefoon
+# pauzeert zodat snel SPATIE tikken niet steeds opnieuw start
+
+# prewarm_sounds() decodeert LazySounds vooraf (PlayScene.enter: de play-loops), zodat de
+# eerste voetstappen/het eerste gebabbel niet midden in PLAY gedecodeerd worden
+
+# stop_all_loop_sounds() stopt alle loopende sounds bij scene switch
 import os
+from collections import OrderedDict
 import pygame
-from config import ASSETS_DIR
+from config import ASSETS_DIR, AUDIO_STREAM_MIN_BYTES, AUDIO_PCM_CACHE_MB, LOOP_FADE_MS
+
+# sound -> rol (= gereserveerd kanaal)
+LOOP_ROLES = {
+    "typing": "work",
+    "phone_use": "phone",
+    "boss_walk": "walk",
+    "boss_chatter": "chatter",
+    "boss3_chatter": "chatter",
+}
+ROLE_ORDER = ("work", "phone", "walk", "chatter")
+PLAY_LOOPS = ("typing", "boss_walk", "boss_chatter", "boss3_chatter")
+PAUSE_ROLES = ("work", "phone")   # deze hervatten i.p.v. opnieuw te starten
 
 def safe_sound(path, volume=None):
     try:
@@ -19,21 +42,218 @@ def safe_sound(path, volume=None):
     except Exception:
         return pygame.mixer.Sound(b"\x00\x00\x00\x00")
 
+def pcm_bytes(sound) -> int:
+    init = pygame.mixer.get_init()
+    if not init:
+        return 0
+    freq, size, channels = init
+    return int(sound.get_length() * freq * channels * abs(size) // 8)
+
+class SoundBank:
+    # Decoded-PCM cache voor LazySounds; verwijdert de langst niet gebruikte
+    # (en niet spelende) sounds als het budget overschreden wordt.
+    def __init__(self, budget_mb=AUDIO_PCM_CACHE_MB):
+        self.budget = int(budget_mb * 1024 * 1024)
+        self._pcm = OrderedDict()   # LazySound -> pygame.mixer.Sound
+        self.current_stream = None  # StreamedSound die nu in mixer.music zit
+        self.stats = {"decodes": 0, "evictions": 0}
+
+    def peek(self, lazy):
+        return self._pcm.get(lazy)
+
+    def decoded(self, lazy):
+        sound = self._pcm.get(lazy)
+        if sound is not None:
+            self._pcm.move_to_end(lazy)
+            return sound
+        sound = safe_sound(lazy.path, lazy.volume)
+        self.stats["decodes"] += 1
+        self._pcm[lazy] = sound
+        self._evict(keep=lazy)
+        return sound
+
+    def cached_bytes(self):
+        return sum(pcm_bytes(s) for s in self._pcm.values())
+
+    def _evict(self, keep):
+        for victim in list(self._pcm):
+            if self.cached_bytes() <= self.budget:
+                break
+            if victim is keep or self._pcm[victim].get_num_channels() > 0:
+                continue
+            del self._pcm[victim]
+            self.stats["evictions"] += 1
+
+class LazySound:
+    is_streamed = False
+
+    def __init__(self, bank, path, volume=None):
+        self.bank = bank
+        self.path = path
+        self.volume = volume
+
+    def sound(self):
+        return self.bank.decoded(self)
+
+    def play(self, loops=0, maxtime=0, fade_ms=0):
+        return self.sound().play(loops, maxtime, fade_ms)
+
+    def stop(self):
+        # stoppen hoeft niet te decoderen: niet gedecodeerd = speelt niet
+        sound = self.bank.peek(self)
+        if sound is not None:
+            sound.stop()
+
+    def fadeout(self, ms):
+        sound = self.bank.peek(self)
+        if sound is not None:
+            sound.fadeout(ms)
+
+    def set_volume(self, volume):
+        self.volume = volume
+        sound = self.bank.peek(self)
+        if sound is not None:
+            sound.set_volume(volume)
+
+    def get_num_channels(self):
+        sound = self.bank.peek(self)
+        return sound.get_num_channels() if sound is not None else 0
+
+class StreamedSound:
+    is_streamed = True
+
+    def __init__(self, bank, path, volume=None):
+        self.bank = bank
+        self.path = path
+        self.volume = volume
+
+    def is_current(self):
+        return self.bank.current_stream is self
+
+    def play(self, loops=0, maxtime=0, fade_ms=0):
+        try:
+            if not self.is_current():
+                pygame.mixer.music.load(self.path)
+                self.bank.current_stream = self
+            pygame.mixer.music.set_volume(1.0 if self.volume is None else self.volume)
+            pygame.mixer.music.play(loops, fade_ms=fade_ms)
+        except pygame.error:
+            self.bank.current_stream = None
+
+    def stop(self):
+        if self.is_current():
+            pygame.mixer.music.stop()
+
+    def fadeout(self, ms):
+        if self.is_current():
+            pygame.mixer.music.fadeout(ms)
+
+    def set_volume(self, volume):
+        self.volume = volume
+        if self.is_current():
+            pygame.mixer.music.set_volume(volume)
+
+    def get_num_channels(self):
+        return 1 if self.is_current() and pygame.mixer.music.get_busy() else 0
+
+def sound_for(bank, filename, volume=None):
+    path = os.path.join(ASSETS_DIR, filename)
+    try:
+        big = os.path.getsize(path) >= AUDIO_STREAM_MIN_BYTES
+    except OSError:
+        big = False
+    if big:
+        return StreamedSound(bank, path, volume)
+    return LazySound(bank, path, volume)
+
 def load_sounds():
+    bank = SoundBank()
     return {
-        "boss_walk": safe_sound(os.path.join(ASSETS_DIR, "loud-footsteps-62038-VEED.mp3")),
-        "typing": safe_sound(os.path.join(ASSETS_DIR, "typing-keyboard-asmr-356116.mp3")),
-        "phone_use": safe_sound(os.path.join(ASSETS_DIR, "Mathias Vandenboer_s Video - Dec 16, 2025-VEED.mp3.mp3")),
-        "boss_chatter": safe_sound(os.path.join(ASSETS_DIR, "angry-boss-chatter.mp3"), volume=0.8),
-        "boss3_chatter": safe_sound(os.path.join(ASSETS_DIR, "gibberish-1-96231"), volume=0.8),
-        "game_over": safe_sound(os.path.join(ASSETS_DIR, "game_over.wav")),
-        "complete": safe_sound(os.path.join(ASSETS_DIR, "level_complete.wav")),
-        "buy": safe_sound(os.path.join(ASSETS_DIR, "purchase-success-384963.mp3")),
-        "menu_click": safe_sound(os.path.join(ASSETS_DIR, "menu_click.wav")),
+        "boss_walk": sound_for(bank, "loud-footsteps-62038-VEED.mp3"),
+        "typing": sound_for(bank, "typing-keyboard-asmr-356116.mp3"),
+        "phone_use": sound_for(bank, "Mathias Vandenboer_s Video - Dec 16, 2025-VEED.mp3.mp3"),
+        "boss_chatter": sound_for(bank, "angry-boss-chatter.mp3", volume=0.8),
+        "boss3_chatter": sound_for(bank, "gibberish-1-96231", volume=0.8),
+        "game_over": sound_for(bank, "game_over.wav"),
+        "complete": sound_for(bank, "level_complete.wav"),
+        "buy": sound_for(bank, "purchase-success-384963.mp3"),
+        "menu_click": sound_for(bank, "menu_click.wav"),
     }
 
-def stop_all_loop_sounds(snd):
-    snd["boss_walk"].stop()
-    snd["typing"].stop()
-    snd["phone_use"].stop()
-    snd["boss_chatter"].stop()
+def prewarm_sounds(snd, names):
+    for name in names:
+        sound = snd.get(name)
+        if sound is not None and not sound.is_streamed:
+            sound.sound()
+
+class LoopChannels:
+    def __init__(self, snd, fade_ms=LOOP_FADE_MS):
+        self.snd = snd
+        self.fade_ms = fade_ms
+        pygame.mixer.set_reserved(len(ROLE_ORDER))
+        self.channels = {role: pygame.mixer.Channel(i) for i, role in enumerate(ROLE_ORDER)}
+        self.current = {role: None for role in ROLE_ORDER}   # sound die de rol nu heeft
+        self.paused = {role: False for role in ROLE_ORDER}
+        self.stats = {"starts": 0, "resumes": 0, "deduped": 0}
+
+    def is_playing(self, name):
+        role = LOOP_ROLES[name]
+        return self.current[role] == name and not self.paused[role]
+
+    def play(self, name):
+        role = LOOP_ROLES[name]
+        sound = self.snd[name]
+
+        if self.current[role] == name:
+            if self.paused[role]:
+                self._resume(role, sound)
+                self.stats["resumes"] += 1
+                return
+            if sound.get_num_channels() > 0:
+                self.stats["deduped"] += 1
+                return
+
+        if sound.is_streamed:
+            sound.play(-1, fade_ms=self.fade_ms)
+        else:
+            # een ander geluid op dit kanaal wordt vervangen, het nieuwe fadet in
+            self.channels[role].play(sound.sound(), loops=-1, fade_ms=self.fade_ms)
+        self.current[role] = name
+        self.paused[role] = False
+        self.stats["starts"] += 1
+
+    def _resume(self, role, sound):
+        if sound.is_streamed:
+            pygame.mixer.music.unpause()
+        else:
+            self.channels[role].unpause()
+        self.paused[role] = False
+
+    def stop(self, name):
+        role = LOOP_ROLES[name]
+        if self.current[role] != name or self.paused[role]:
+            return
+        sound = self.snd[name]
+        if role in PAUSE_ROLES:
+            if sound.is_streamed:
+                pygame.mixer.music.pause()
+            else:
+                self.channels[role].pause()
+            self.paused[role] = True
+        else:
+            if sound.is_streamed:
+                sound.fadeout(self.fade_ms)
+            else:
+                self.channels[role].fadeout(self.fade_ms)
+            self.current[role] = None
+
+    def stop_all(self):
+        for role, name in self.current.items():
+            if name is not None and self.snd[name].is_streamed:
+                self.snd[name].stop()
+            self.channels[role].stop()
+            self.current[role] = None
+            self.paused[role] = False
+
+def stop_all_loop_sounds(loops):
+    loops.stop_all()
@@ -0,0 +1,96 @@
+# audio_latency.py
+# Mixer-instellingen (normaal / low-latency) en meten van de echte output-latency.
+
+# init_mixer() start de mixer met AUDIO_BUFFER of (low-latency) AUDIO_BUFFER_LOW_LATENCY
+
+# measure_latency_steps() speelt een korte stille sound en meet hoe lang het kanaal bezig blijft;
+# wat er boven de lengte van de sound uitkomt is de vertraging van de mixer-callback,
+# daarbovenop komt de buffer die nog naar de geluidskaart moet (buffer / frequentie)
+# Eén meetronde per stap: het is een taak (tasks.py) die pas na het eerste menu-frame draait
+
+# cached_latency() geeft de latency in seconden, per machine/instelling gecached in CACHE_DIR,
+# of None als er nog gemeten moet worden; calibrate_steps() meet dan, schrijft de cache en geeft
+# het resultaat aan on_done (tot dan rekent de game met 0.0)
+# (de boss-voetstappen worden zoveel eerder gestart, zie schedule_next_check())
+import json
+import os
+import time
+import pygame
+from config import (
+    CACHE_DIR, AUDIO_FREQUENCY, AUDIO_BUFFER, AUDIO_BUFFER_LOW_LATENCY,
+    AUDIO_LOW_LATENCY, AUDIO_CALIBRATE,
+)
+
+LATENCY_CACHE_PATH = os.path.join(CACHE_DIR, "audio_latency.json")
+
+def init_mixer():
+    buffer = AUDIO_BUFFER_LOW_LATENCY if AUDIO_LOW_LATENCY else AUDIO_BUFFER
+    pygame.mixer.pre_init(AUDIO_FREQUENCY, -16, 2, buffer)
+    pygame.mixer.init(AUDIO_FREQUENCY, -16, 2, buffer)
+    return buffer
+
+def buffer_latency(buffer):
+    init = pygame.mixer.get_init()
+    freq = init[0] if init else AUDIO_FREQUENCY
+    return buffer / freq
+
+def measure_latency_steps(buffer, rounds=8, length=0.01):
+    # generator: yield tussen de rondes, het resultaat is de return-waarde
+    init = pygame.mixer.get_init()
+    if not init:
+        return 0.0
+    freq, size, channels = init
+    n = int(freq * length)
+    sound = pygame.mixer.Sound(buffer=bytes(n * channels * abs(size) // 8))
+    channel = pygame.mixer.find_channel(True)
+
+    samples = []
+    try:
+        for _ in range(rounds):
+            yield
+            t0 = time.perf_counter()
+            channel.play(sound)
+            while channel.get_busy() and time.perf_counter() - t0 < 1.0:
+                time.sleep(0.0005)
+            samples.append(time.perf_counter() - t0 - length)
+    finally:
+        channel.stop()
+
+    samples.sort()
+    callback_delay = max(0.0, samples[len(samples) // 2])
+    return callback_delay + buffer_latency(buffer)
+
+def _cache_key(buffer):
+    freq, size, channels = pygame.mixer.get_init()
+    driver = os.environ.get("SDL_AUDIODRIVER", "default")
+    return f"{driver}:{freq}:{size}:{channels}:{buffer}"
+
+def _read_cache():
+    try:
+        with open(LATENCY_CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+def cached_latency(buffer):
+    if not pygame.mixer.get_init():
+        return 0.0
+    if not AUDIO_CALIBRATE:
+        return buffer_latency(buffer)
+    cache = _read_cache()
+    key = _cache_key(buffer)
+    if key in cache:
+        return float(cache[key])
+    return None
+
+def calibrate_steps(buffer, on_done):
+    latency = yield from measure_latency_steps(buffer)
+    cache = _read_cache()
+    cache[_cache_key(buffer)] = round(latency, 4)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(LATENCY_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+    except Exception:
+        pass
+    on_done(latency)
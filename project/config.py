@@ -12,11 +12,27 @@
 
 
 import os
+import tempfile
 
 FPS = 60
+INPUT_POLL_MS = 1   # hoe vaak input gelezen wordt terwijl we op het volgende frame wachten
+TASK_SLACK_MS = 2.0   # achtergrondtaken (tasks.py) stoppen zoveel ms voor het volgende frame
 
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
 SAVE_PATH  = os.path.join(os.path.dirname(__file__), "save.json")
+CACHE_DIR  = os.path.join(os.path.dirname(__file__), "cache")  # gegenereerde bestanden (niet in git)
+BUILD_DIR  = os.path.join(ASSETS_DIR, "build")  # output van asset_build.py (niet in git)
+BUILD_COMPRESS = False   # True: zlib (kleiner op schijf, maar trager laden dan ruwe pixels)
+BUILD_MIP_LEVELS = (2, 4)   # extra varianten op 1/2 en 1/4 van de bronresolutie
+
+# Meetmodus: input -> state -> flip latency per scene/resolutie
+LATENCY_METRICS = False
+LATENCY_REPORT_PATH = os.path.join(CACHE_DIR, "latency_report.json")
+
+# Meetmodus: opstart-tijdlijn (fases + import-tijden) tot en met het eerste frame
+STARTUP_PROFILE = False
+STARTUP_PROFILE_PATH = os.path.join(CACHE_DIR, "startup_profile.json")
+STARTUP_PROFILE_HISTORY = 20   # aantal eerdere time-to-first-frame metingen in het bestand
 
 PHONE_POINTS_PER_SEC = 10
 MAX_HOLD_BONUS = 3.0
@@ -38,6 +54,71 @@ COINS_FIRST_CLEAR_BONUS = 100
 
 POPUP_DURATION = 1.4
 
+# Geheugen voor gedecodeerde images (bronnen + geschaalde layout surfaces)
+IMAGE_RAM_BUDGET_MB = 256
+DEBUG_MEMORY = False   # print surface_registry rapport na recalc_layout
+
+# Audio mixer: low-latency = kleinere buffer (meer kans op haperingen op trage machines)
+AUDIO_FREQUENCY = 44100
+AUDIO_BUFFER = 512
+AUDIO_BUFFER_LOW_LATENCY = 128
+AUDIO_LOW_LATENCY = False
+AUDIO_CALIBRATE = True    # latency één keer meten per machine (anders schatting uit de buffer)
+
+# Audio: bestanden vanaf deze grootte streamen (mixer.music), de rest lazy decoderen
+AUDIO_STREAM_MIN_BYTES = 1_000_000
+AUDIO_PCM_CACHE_MB = 32   # max gedecodeerde PCM in geheugen (LRU)
+LOOP_FADE_MS = 40         # korte fade bij starten/stoppen van loops (geen klikjes)
+
+# Aantal processen om PNG's te decoderen (0 = automatisch per core, 1 = serieel)
+DECODE_WORKERS = 0
+
+# Geschaalde assets delen tussen game-instances op dezelfde machine (mmap)
+SHARED_ASSET_STORE = True
+SHARED_STORE_DIR = os.path.join("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(), "office_game_assets")
+# Opruimen bij het opstarten: bestanden die langer dan zoveel dagen niet gebruikt zijn weg, en
+# daarna de oudste tot de map onder het maximum zit (0 = geen grens); wat in de laatste
+# KEEP_HOURS gebruikt is telt als werkset en blijft staan (één 4K-set is al ~200 MB)
+SHARED_STORE_MAX_AGE_DAYS = 14
+SHARED_STORE_MAX_MB = 256
+SHARED_STORE_KEEP_HOURS = 24
+
+# Kwaliteit automatisch omlaag bij trage frames (zie quality.py); start op "high"/"medium"/"low"/"minimal"
+QUALITY_GOVERNOR = True
+QUALITY_START = "high"
+QUALITY_WINDOW = 60      # frames waarover het gemiddelde genomen wordt
+QUALITY_DOWN_AT = 0.9    # x framebudget: omlaag
+QUALITY_UP_AT = 0.5      # x framebudget: weer omhoog
+QUALITY_LOG = False
+QUALITY_HISTORY = 32     # laatste wissels die bewaard worden (decisions)
+
+# Garbage collection: na het opstarten gc.freeze(), tijdens PLAY geen (trage) gen-2 collecties,
+# bij scene-wissels wel een volledige; GC_LOG print de pauzes per scene bij afsluiten
+GC_POLICY = True
+GC_LOG = False
+
+# Interne render-resolutie: "native" of bv. (960, 540) / (1280, 720); assets en layout worden
+# voor die grootte geschaald en het (SCALED) scherm schaalt op naar de monitor
+RENDER_RESOLUTION = "native"
+
+# "High"-effect: de play-scene wordt in een offscreen buffer getekend (schaal t.o.v. het scherm,
+# 0.5 = kwart van de pixels) en daar geschud/gekleurd/gewobbeld; 0 = geen wobble
+# HIGH_FX_MAX_SIZE begrenst die buffer, zodat de kosten niet meegroeien met de resolutie
+HIGH_FX_SCALE = 0.5
+HIGH_FX_MAX_SIZE = (960, 540)
+HIGH_FX_WOBBLE_PX = 6
+
+# Transparante randen van sprites wegknippen (sprites.py): alpha onder TRIM_MIN_ALPHA telt als
+# leeg, en alleen trimmen als er hoogstens TRIM_MAX_KEEP van de oppervlakte overblijft
+TRIM_MIN_ALPHA = 8
+TRIM_MAX_KEEP = 0.9
+
+# Texture-atlassen (atlas.py): maximale breedte van een atlas-surface
+ATLAS_MAX_WIDTH = 2048
+
+# Sterren worden één keer op N x de grootte getekend en verkleind (anti-aliasing)
+STAR_SUPERSAMPLE = 4
+
 # Main menu settings
 MAIN_MENU_BG_COLOR = (45, 55, 70)
 BUTTON_BG_COLOR = (109, 52, 18)
@@ -52,6 +133,11 @@ COL_CARD_BG  = (255, 248, 225)
 COL_BORDER   = (109, 52, 18)
 COL_MUTED    = (170, 150, 120)
 
+# Shop grid
+SHOP_GRID_COLS = 3
+SHOP_THUMB_CACHE_SIZE = 48   # max aantal thumbnails in geheugen (LRU)
+SHOP_FILTERS = ("all", "owned", "unowned")
+
 SHOP_ITEMS = {
     # --- Laptops ---
     "laptop_default": {"type": "laptop", "price": 0,   "file": "laptopnohands.png",   "name": "Laptop Default"},
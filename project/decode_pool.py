@@ -0,0 +1,110 @@
+# decode_pool.py
+# PNG's parallel decoderen over meerdere cores.
+
+# decode_files() decodeert in een process pool naar ruwe RGBA bytes;
+# het hoofdproces maakt er met surface_from_rgba() (frombuffer + convert_source) Surfaces van
+
+# Met 1 core (of DECODE_WORKERS = 1) wordt gewoon serieel gedecodeerd
+
+# De pool blijft bestaan tot shutdown_pool() (na het opstarten en bij het verlaten van de shop)
+# start_pool() start de workers al (bv. bij ShopScene.enter); submit_file() gebruikt alleen een
+# pool die al draait, zodat er nooit midden in een frame processen opgestart worden
+
+# submit_file() geeft een Future voor één bestand (alleen met een draaiende pool, anders None);
+# een taak kan die per frame pollen en daarna future_surface() aanroepen
+
+# Workers (spawn) importeren main.py opnieuw; die heeft geen imports bovenaan, dus een worker
+# laadt alleen deze module (pygame + utils) en niet de hele game
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+import pygame
+from config import DECODE_WORKERS
+from utils import load_image, load_image_raw, surface_from_rgba
+
+_pool = None
+_pool_size = 0
+
+def worker_count(n_files):
+    cores = os.cpu_count() or 1
+    workers = DECODE_WORKERS if DECODE_WORKERS > 0 else cores
+    return max(1, min(workers, cores, n_files))
+
+def _decode_worker(job):
+    # draait in een apart proces: geen display, dus geen convert hier
+    filename, target = job
+    try:
+        surf = load_image_raw(filename, target)
+        return surf.get_size(), pygame.image.tobytes(surf, "RGBA")
+    except Exception:
+        return None
+
+def _get_pool(workers):
+    global _pool, _pool_size
+    if _pool is None or _pool_size < workers:
+        shutdown_pool()
+        # spawn: de workers erven geen SDL/display state van het hoofdproces
+        _pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+        _pool_size = workers
+    return _pool
+
+def _warm_worker():
+    return os.getpid()
+
+def start_pool(n_files):
+    workers = worker_count(n_files)
+    if workers <= 1:
+        return
+    pool = _get_pool(workers)
+    # processen worden pas bij een submit gestart; dan maar meteen (de eerste import duurt even)
+    for _ in range(workers):
+        pool.submit(_warm_worker)
+
+def shutdown_pool():
+    global _pool, _pool_size
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        _pool_size = 0
+
+def submit_file(filename, target=None):
+    if _pool is None:
+        return None
+    try:
+        return _pool.submit(_decode_worker, (filename, target))
+    except RuntimeError:
+        return None   # pool is net afgesloten
+
+def future_surface(future):
+    # None als de decode mislukte of geannuleerd is (shutdown_pool bij het verlaten van de shop)
+    try:
+        res = future.result(0)
+    except Exception:
+        return None
+    if res is None:
+        return None
+    size, data = res
+    return surface_from_rgba(size, data)
+
+def decode_files(files, targets=None):
+    # files: dict key -> bestandsnaam in ASSETS_DIR; targets: optioneel key -> (w, h) waarnaar
+    # geschaald gaat worden (kleinere build-variant mag); geeft key -> Surface (mislukte keys ontbreken)
+    out = {}
+    targets = targets or {}
+    workers = worker_count(len(files))
+
+    if workers <= 1:
+        for key, filename in files.items():
+            try:
+                out[key] = load_image(filename, targets.get(key))
+            except Exception:
+                pass
+        return out
+
+    keys = list(files)
+    results = _get_pool(workers).map(_decode_worker, [(files[k], targets.get(k)) for k in keys])
+    for key, res in zip(keys, results):
+        if res is not None:
+            size, data = res
+            out[key] = surface_from_rgba(size, data)
+    return out
@@ -0,0 +1,379 @@
+# game.py
+
+#De game zelf (gestart vanuit main.py).
+#Start pygame + fullscreen window (op RENDER_RESOLUTION, SCALED schaalt op naar de monitor)
+#Maakt de Game class (bevat alle globale game-data)
+#Doet de main loop: events lezen → scene update → scene draw → flip()
+#Bij een scene change: loops stoppen, exit()/enter() van de scenes (scenes/)
+#Opstarttijd per fase (en per import) met STARTUP_PROFILE, zie startup_profile.py
+#Garbage collection: freeze na het opstarten, volledige collecties bij scene-wissels (gc_policy.py)
+#Na de flip: achtergrondtaken in de tijd tot het volgende frame (tasks.py), bij afsluiten alles af
+
+
+import time
+import pygame
+import random
+
+from config import (
+    FPS, GRID_COLS, GRID_ROWS, TOTAL_LEVELS, DEBUG_MEMORY, RENDER_RESOLUTION,
+    DESK_Y_OFFSET, HANDS_Y_OFFSET,
+    COL_BORDER, COL_TEXT, COL_PANEL_BG, COL_CARD_BG, COL_MUTED,
+)
+from constants import (
+    SCENE_MAIN_MENU, SCENE_LEVEL_SELECT, SCENE_PLAY, SCENE_COMPLETE, SCENE_GAMEOVER, SCENE_SHOP
+)
+from save_system import load_save
+from assets import load_images
+from asset_build import check_build
+from audio import load_sounds, stop_all_loop_sounds, LoopChannels
+from audio_latency import init_mixer, cached_latency, calibrate_steps
+from ui import draw_star_row, button, ui_button, menu_button, tab_button
+from shop import build_catalog_index, build_shop_thumbs, reload_equipped_assets
+from decode_pool import shutdown_pool
+from state import make_initial_play_state
+from input_timing import InputClock
+from latency_metrics import LatencyTracker
+from postfx import PostFX
+from render_queue import RenderQueue
+from quality import QualityGovernor
+from gc_policy import GCPolicy
+from tasks import TaskScheduler, call_steps
+from startup_profile import STARTUP
+from play_layers import invalidate_play_layers
+from scenes import SceneRegistry  # scene-modules worden pas bij gebruik geïmporteerd
+
+STARTUP.mark("imports")
+
+# taken die bij afsluiten nog afgemaakt worden (de rest wordt geannuleerd)
+QUIT_TASKS = ("save", "thumb_store", "startup_profile")
+
+def render_size(native, setting=RENDER_RESOLUTION):
+    # nooit groter renderen dan de monitor; SCALED schaalt het resultaat op (met balken
+    # als de beeldverhouding anders is)
+    if setting in (None, "native"):
+        return native
+    try:
+        w, h = int(setting[0]), int(setting[1])
+    except (TypeError, ValueError, IndexError):
+        return native
+    if w <= 0 or h <= 0 or w > native[0] or h > native[1]:
+        return native
+    return w, h
+
+class Game:
+    def __init__(self):
+        with STARTUP.phase("mixer"):
+            self.audio_buffer = init_mixer()
+        with STARTUP.phase("display"):
+            # alleen wat de game gebruikt; pygame.init() start ook joystick e.d.
+            pygame.display.init()
+            pygame.font.init()
+
+            info = pygame.display.Info()
+            self.WIDTH, self.HEIGHT = render_size((info.current_w, info.current_h))
+
+            self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT), pygame.FULLSCREEN | pygame.SCALED)
+            pygame.display.set_caption("Office Game - Main Menu + Shop")
+        self.input = InputClock(FPS)
+        self.latency = LatencyTracker()
+        self.postfx = PostFX((self.WIDTH, self.HEIGHT))
+        self.render_queue = RenderQueue()
+        self.quality = QualityGovernor(FPS)
+        self.gc = GCPolicy()
+        self.tasks = TaskScheduler(FPS)
+
+        with STARTUP.phase("images"):
+            self.img = load_images()
+        with STARTUP.phase("sounds"):
+            self.snd = load_sounds()
+            self.loops = LoopChannels(self.snd)
+        with STARTUP.phase("audio_latency"):
+            latency = cached_latency(self.audio_buffer)
+        # eerste start op deze machine: meten als taak (na het eerste frame, niet in PLAY)
+        self.audio_latency = 0.0 if latency is None else latency
+        if latency is None:
+            self.tasks.add("audio_latency", calibrate_steps(self.audio_buffer, self._set_audio_latency))
+
+        with STARTUP.phase("save"):
+            self.save = load_save()
+
+        self.scene = SCENE_MAIN_MENU
+        self.scenes = SceneRegistry()
+        self.running = True
+
+        self.selected_level = 1
+        self.last_run_score = 0
+        self.last_run_level = 1
+        self.last_run_stars = 0
+
+        self.shop_selected_id = None
+        self.shop_tab = "phone"
+        self.shop_filter = "all"
+        self.shop_scroll = 0
+        self.shop_catalog = build_catalog_index()
+        self.popup_text = ""
+        self.popup_timer = 0.0
+
+        self.play = make_initial_play_state()
+
+        with STARTUP.phase("fonts"):
+            self._setup_fonts()
+
+        self.mode = "level"   # of MODE_LEVEL
+
+
+        # Layout container
+        self.layout = {
+            "background_s": None,
+            "main_menu_bg": None,
+            "caught_bg": None,
+            "level_select_bg": None,
+
+            "desk_s": None,
+            "desk_h": 0,
+            "desk_scale": 1.0,
+            "DESK_POS": (0, 0),
+
+            "TILE_W": 140,
+            "TILE_H": 110,
+            "GRID_TOP": 140,
+            "GRID_LEFT": 0,
+
+            "LAPTOP_SIZE": (520, 260),
+            "LAPTOP_POS": (0, 0),
+
+            "PHONE_SIZE": (300, 300),
+            "PHONE_POS": (0, 0),
+
+            "hands_0_s": None,
+            "hands_1_s": None,
+            "smoking_hand_s": None,
+
+            "img_phone_skin": None,
+            "phone_skin_s": None,
+
+            "BOSS_FAR": (190, 285),
+            "BOSS_NEAR": (190, 285),
+            "BOSS_END_Y": 0,
+            "BOSS_START_Y": 0,
+
+            "THUMB_W": 180,
+            "THUMB_H": 95,
+
+            "laptop_nohands_s": None,
+        }
+
+        with STARTUP.phase("layout"):
+            self.recalc_layout()
+
+        # Thumbs
+        with STARTUP.phase("shop_thumbs"):
+            self.shop_thumbs = build_shop_thumbs(self.layout["THUMB_W"], self.layout["THUMB_H"])
+
+        self.img.track("layout", self.layout)
+        self.img.track("shop_thumbs", self.shop_thumbs)
+
+        # Equipped assets
+        with STARTUP.phase("equipped"):
+            reload_equipped_assets(self.save, self.layout, self.img)
+            shutdown_pool()
+        self.report_memory()
+
+        # UI function shortcuts
+        self.draw_star_row = lambda x,y,n,size=18,gap=8: draw_star_row(self.screen, x, y, n, size, gap)
+        self.button = lambda rect, text, enabled=True: button(self.screen, self.font, rect, text, enabled)
+        self.ui_button = lambda rect, text, enabled=True: ui_button(self.screen, self.font, rect, text, enabled)
+        self.menu_button = lambda rect, text, enabled=True: menu_button(self.screen, self.font, rect, text, enabled)
+        self.tab_button = lambda rect, text, active: tab_button(self.screen, self.font, rect, text, active, COL_BORDER, COL_TEXT)
+        self.gc.after_startup()
+        STARTUP.mark("init")
+
+    def _setup_fonts(self):
+        sy = self.HEIGHT / 540
+        self.font = pygame.font.SysFont(None, max(18, int(28 * sy)))
+        self.small = pygame.font.SysFont(None, max(14, int(22 * sy)))
+        self.big = pygame.font.SysFont(None, max(34, int(72 * sy)))
+        self.title_font = pygame.font.SysFont(None, max(40, int(86 * sy)))
+
+    def set_popup(self, text, duration):
+        self.popup_text = text
+        self.popup_timer = duration
+
+    def _set_audio_latency(self, latency):
+        self.audio_latency = latency
+
+    def stop_all_loop_sounds(self):
+        stop_all_loop_sounds(self.loops)
+
+    def report_memory(self):
+        if DEBUG_MEMORY:
+            print("\n".join(self.img.report()))
+            ok, stale = check_build()
+            print(f"  asset build: {ok} ok, {stale} verouderd")
+
+    def recalc_layout(self):
+        sx = self.WIDTH / 960
+        sy = self.HEIGHT / 540
+
+        full = (self.WIDTH, self.HEIGHT)
+        scaled = {"background_s": ("background",) + full}
+
+        if self.img["HAS_MENU_BG"]:
+            scaled["main_menu_bg"] = ("main_menu_bg",) + full
+        if self.img["HAS_CAUGHT_BG"]:
+            scaled["caught_bg"] = ("caught_bg",) + full
+        if self.img["HAS_LEVEL_SELECT_BG"]:
+            scaled["level_select_bg"] = ("level_select_bg",) + full
+
+        self.layout["TILE_W"] = int(140 * sx)
+        self.layout["TILE_H"] = int(110 * sy)
+        self.layout["GRID_TOP"] = int(140 * sy)
+        self.layout["GRID_LEFT"] = (self.WIDTH - GRID_COLS * self.layout["TILE_W"]) // 2
+
+        desk_w0, desk_h0 = self.img.source_size("desk")
+        desk_scale = self.WIDTH / desk_w0
+        desk_h = int(desk_h0 * desk_scale - 120 * sy)
+        self.layout["desk_scale"] = desk_scale
+        self.layout["desk_h"] = desk_h
+        scaled["desk_s"] = ("desk", self.WIDTH, desk_h)
+        self.layout["DESK_POS"] = (0, self.HEIGHT - desk_h + int(DESK_Y_OFFSET * sy))
+
+        laptop_w = int(self.WIDTH * 0.54)
+        laptop_h = int(laptop_w * (260 / 520))
+        self.layout["LAPTOP_SIZE"] = (laptop_w, laptop_h)
+        self.layout["LAPTOP_POS"] = (self.WIDTH // 2 - laptop_w // 2, self.HEIGHT - laptop_h - int(22 * sy))
+
+        phone_w = int(laptop_w * (300 / 520))
+        phone_h = phone_w
+        self.layout["PHONE_SIZE"] = (phone_w, phone_h)
+        self.layout["PHONE_POS"] = (
+            self.WIDTH // 2 - phone_w // 2,
+            self.layout["LAPTOP_POS"][1] + (laptop_h // 2 - phone_h // 2) + int(6 * sy)
+        )
+
+        scaled["hands_0_s"] = ("hands_0",) + self.layout["LAPTOP_SIZE"]
+        scaled["hands_1_s"] = ("hands_1",) + self.layout["LAPTOP_SIZE"]
+        scaled["smoking_hand_s"] = ("smoking_hand",) + self.layout["LAPTOP_SIZE"]
+
+        self.layout["BOSS_FAR"] = (int(190 * sx), int(285 * sy))
+        self.layout["BOSS_NEAR"] = (int(190 * sx), int(285 * sy))
+        self.layout["BOSS_END_Y"] = self.layout["LAPTOP_POS"][1] + int(12 * sy)
+        self.layout["BOSS_START_Y"] = self.layout["BOSS_END_Y"]
+
+        self.layout["THUMB_W"] = int(180 * sx)
+        self.layout["THUMB_H"] = int(95 * sy)
+        self.layout["complete_bg"] = None
+        if self.img.get("HAS_COMPLETE_BG"):
+            scaled["complete_bg"] = ("complete_bg",) + full
+
+        # alles wat nog niet in de shared store zit wordt in één batch (parallel) gedecodeerd
+        self.layout.update(self.img.scaled_many(scaled))
+        invalidate_play_layers(self.layout)
+
+        # bronnen zijn nu geschaald; bij een volgende recalc_layout worden ze opnieuw gedecodeerd
+        self.img.release_sources()
+
+    def handle_event(self, event):
+        # geeft True terug bij een linker muisklik
+        click = False
+        if event.type == pygame.QUIT:
+            self.running = False
+
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            click = True
+            if self.scene == SCENE_MAIN_MENU:
+                self.snd["menu_click"].play()
+
+        if event.type == pygame.MOUSEWHEEL and self.scene == SCENE_SHOP:
+            self.shop_scroll -= event.y * int(self.HEIGHT * 0.08)
+
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                if self.scene == SCENE_PLAY:
+                    self.scene = SCENE_MAIN_MENU
+                elif self.scene in (SCENE_LEVEL_SELECT, SCENE_SHOP, SCENE_COMPLETE, SCENE_GAMEOVER):
+                    self.scene = SCENE_MAIN_MENU
+
+            if self.scene == SCENE_PLAY:
+                if event.key == pygame.K_SPACE and not self.play["gameover"]:
+                    self.play["phone"] = True
+                    self.loops.stop("typing")
+                    self.loops.play("phone_use")
+
+                if event.key == pygame.K_c and not self.play["gameover"] and not self.play["phone"]:
+                    self.play["smoking"] = True
+                    self.loops.stop("typing")
+
+            if event.key == pygame.K_r and self.scene in (SCENE_GAMEOVER, SCENE_COMPLETE):
+                self.scene = SCENE_MAIN_MENU
+
+        if event.type == pygame.KEYUP:
+            if self.scene == SCENE_PLAY and event.key == pygame.K_SPACE:
+                self.play["phone"] = False
+                self.loops.stop("phone_use")
+                if not self.play["gameover"] and not self.play["smoking"]:
+                    self.loops.play("typing")
+
+            if self.scene == SCENE_PLAY and event.key == pygame.K_c:
+                self.play["smoking"] = False
+                if not self.play["gameover"]:
+                    self.loops.play("typing")
+
+        return click
+
+    def play_running(self):
+        return self.scene == SCENE_PLAY and not self.play["gameover"]
+
+    def run(self):
+        while self.running:
+            frame_prev, frame_now, events = self.input.tick()
+            dt = frame_now - frame_prev
+
+            if self.popup_timer > 0:
+                self.popup_timer = max(0.0, self.popup_timer - dt)
+
+            # scene change: loops stoppen, exit() van de oude en enter() van de nieuwe scene
+            # (geluiden, assets klaarzetten/vrijgeven)
+            if self.scene != self.scenes.current:
+                self.stop_all_loop_sounds()
+                self.scenes.switch(self, self.scene)
+                self.gc.on_scene(self.scene)
+
+            # Play-events worden toegepast op het moment dat ze binnenkwamen: eerst het spel
+            # tot dat tijdstip bijwerken (grace/LOOKING checks), dan pas de toets verwerken.
+            click = False
+            t = frame_prev
+            for stamp, event in events:
+                if event.type in (pygame.KEYDOWN, pygame.KEYUP) and self.play_running():
+                    stamp = min(max(stamp, t), frame_now)
+                    if stamp > t:
+                        self.scenes.update(self, stamp - t)
+                        t = stamp
+                before = (self.play["phone"], self.play["smoking"], self.scene)
+                click = self.handle_event(event) or click
+                if before[2] == SCENE_PLAY and before[:2] != (self.play["phone"], self.play["smoking"]):
+                    self.latency.on_state_change(event, stamp, SCENE_PLAY, (self.WIDTH, self.HEIGHT))
+
+            if self.play_running():
+                self.scenes.update(self, frame_now - t)
+
+            self.scenes.draw(self, click)
+            self.quality.on_frame(time.perf_counter() - frame_now)
+            self.input.poll_events()
+
+            pygame.display.flip()
+            self.latency.on_flip()
+            if STARTUP.first_frame():
+                self.tasks.add("startup_profile", call_steps(STARTUP.write_report))
+
+            # wat er over is tot het volgende frame: achtergrondtaken (opslaan, skins, thumbs, ...)
+            self.tasks.run(self.input.next_frame, self.scene, self.input.poll_events)
+
+        self.latency.write_report()
+        self.scenes.close(self)
+        # alleen wat bewaard moet worden; skins laden en thumbs vooruit decoderen heeft geen zin meer
+        self.tasks.drain(*QUIT_TASKS)
+        self.gc.close()
+        self.shop_thumbs.flush()
+        shutdown_pool()
+        pygame.quit()
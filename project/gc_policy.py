@@ -0,0 +1,84 @@
+# gc_policy.py
+# Bepaalt wanneer Python's garbage collector mag draaien (GC_POLICY in config).
+
+# after_startup(): één volledige collectie en dan gc.freeze(); alles wat bij het opstarten
+# geladen is (assets, layout, modules) wordt daarna nooit meer doorzocht
+
+# on_scene(): bij elke scene-wissel een volledige collectie (daar valt een pauze niet op);
+# in PLAY wordt gen 2 uitgesteld (drempel heel hoog), gen 0/1 blijven gewoon lopen
+# zodat kortlevende cycles toch opgeruimd worden
+
+# GCMonitor (gc.callbacks) telt per scene en generatie het aantal collecties en de pauzes;
+# report() geeft de regels, GC_LOG print ze bij afsluiten
+import gc
+import time
+from config import GC_POLICY, GC_LOG
+from constants import SCENE_PLAY
+
+PLAY_GEN2_THRESHOLD = 1_000_000   # praktisch nooit
+
+class GCMonitor:
+    def __init__(self):
+        self.scene = "startup"
+        self.stats = {}     # (scene, generatie) -> [aantal, totaal s, max s, opgeruimd]
+        self._start = None
+
+    def install(self):
+        if self._callback not in gc.callbacks:
+            gc.callbacks.append(self._callback)
+
+    def remove(self):
+        if self._callback in gc.callbacks:
+            gc.callbacks.remove(self._callback)
+
+    def _callback(self, phase, info):
+        if phase == "start":
+            self._start = time.perf_counter()
+            return
+        if self._start is None:
+            return
+        pause = time.perf_counter() - self._start
+        self._start = None
+        entry = self.stats.setdefault((self.scene, info["generation"]), [0, 0.0, 0.0, 0])
+        entry[0] += 1
+        entry[1] += pause
+        entry[2] = max(entry[2], pause)
+        entry[3] += info["collected"]
+
+    def report(self):
+        lines = ["GC pauzes (scene / generatie: aantal, totaal, max, opgeruimd):"]
+        for (scene, gen), (n, total, worst, collected) in sorted(self.stats.items()):
+            lines.append(f"  {scene} gen{gen}: {n}x, {total * 1000:.1f} ms, max {worst * 1000:.2f} ms, {collected} obj")
+        lines.append(f"  frozen: {gc.get_freeze_count()} obj")
+        return lines
+
+class GCPolicy:
+    def __init__(self, enabled=GC_POLICY, log=GC_LOG):
+        self.enabled = enabled
+        self.log = log
+        self.default_threshold = gc.get_threshold()
+        self.monitor = GCMonitor()
+        self.monitor.install()
+
+    def after_startup(self):
+        if not self.enabled:
+            return
+        gc.collect()
+        gc.freeze()
+
+    def on_scene(self, scene):
+        self.monitor.scene = "transition"
+        if self.enabled:
+            gc.collect()
+            if scene == SCENE_PLAY:
+                gen0, gen1, _ = self.default_threshold
+                gc.set_threshold(gen0, gen1, PLAY_GEN2_THRESHOLD)
+            else:
+                gc.set_threshold(*self.default_threshold)
+        self.monitor.scene = scene
+
+    def close(self):
+        gc.set_threshold(*self.default_threshold)
+        self.monitor.remove()
+        if self.log:
+            print("\n".join(self.monitor.report()))
@@ -0,0 +1,44 @@
+# input_timing.py
+# Input met tijdstempels binnen een frame.
+
+# InputClock vervangt clock.tick(FPS): tijdens het wachten op het volgende frame wordt de
+# event-queue elke INPUT_POLL_MS uitgelezen, zodat elk event het tijdstip krijgt waarop het
+# (bijna) binnenkwam i.p.v. "ergens in het vorige frame"
+
+# tick() geeft (vorige frametijd, huidige frametijd, [(tijdstip, event), ...]);
+# Game.run() past play-events toe op hun eigen tijdstip (zie update_play in stukjes)
+import time
+import pygame
+from config import FPS, INPUT_POLL_MS
+
+class InputClock:
+    def __init__(self, fps=FPS, poll_ms=INPUT_POLL_MS):
+        self.frame_time = 1.0 / fps
+        self.poll = poll_ms / 1000.0
+        self.pending = []
+        self.last_frame = time.perf_counter()
+        self.next_frame = self.last_frame + self.frame_time
+
+    def poll_events(self):
+        events = pygame.event.get()
+        if events:
+            now = time.perf_counter()
+            self.pending.extend((now, event) for event in events)
+
+    def tick(self):
+        self.poll_events()
+        while True:
+            now = time.perf_counter()
+            left = self.next_frame - now
+            if left <= 0:
+                break
+            time.sleep(min(self.poll, left))
+            self.poll_events()
+
+        prev = self.last_frame
+        self.last_frame = now
+        self.next_frame = now + self.frame_time
+
+        events = self.pending
+        self.pending = []
+        return prev, now, events
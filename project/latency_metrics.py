@@ -0,0 +1,87 @@
+# latency_metrics.py
+# Meetmodus voor input-latency (LATENCY_METRICS = True in config).
+
+# Voor elke SPATIE/C druk of loslaat die de play-state verandert:
+# - event_to_state: event binnen (tijdstempel van InputClock) -> toegepast in game.play
+# - state_to_flip:  toegepast -> pygame.display.flip() van het frame dat het toont
+# - event_to_flip:  totaal
+
+# Histogrammen per scene + resolutie; write_report() schrijft ze naar LATENCY_REPORT_PATH
+import json
+import os
+import time
+from collections import deque
+import pygame
+from config import LATENCY_METRICS, LATENCY_REPORT_PATH
+
+BUCKETS_MS = (1, 2, 4, 8, 12, 16, 20, 25, 33, 50, 75, 100)
+STAGES = ("event_to_state", "state_to_flip", "event_to_flip")
+TRACKED_KEYS = {pygame.K_SPACE: "space", pygame.K_c: "c"}
+
+def bucket_label(ms):
+    for edge in BUCKETS_MS:
+        if ms <= edge:
+            return f"<={edge}ms"
+    return f">{BUCKETS_MS[-1]}ms"
+
+class LatencyTracker:
+    def __init__(self, enabled=LATENCY_METRICS, max_samples=5000):
+        self.enabled = enabled
+        self.max_samples = max_samples
+        self.waiting = []   # (arrived, applied, scene, resolution) tot de volgende flip
+        self.groups = {}    # "scene@WxH" -> stage -> {"hist": {...}, "samples": deque}
+
+    def on_state_change(self, event, arrived, scene, resolution):
+        if not self.enabled or event.key not in TRACKED_KEYS:
+            return
+        self.waiting.append((arrived, time.perf_counter(), scene, resolution))
+
+    def on_flip(self):
+        if not self.waiting:
+            return
+        flipped = time.perf_counter()
+        for arrived, applied, scene, resolution in self.waiting:
+            group = f"{scene}@{resolution[0]}x{resolution[1]}"
+            self._add(group, "event_to_state", applied - arrived)
+            self._add(group, "state_to_flip", flipped - applied)
+            self._add(group, "event_to_flip", flipped - arrived)
+        self.waiting.clear()
+
+    def _add(self, group, stage, seconds):
+        stages = self.groups.setdefault(group, {})
+        entry = stages.get(stage)
+        if entry is None:
+            entry = stages[stage] = {"hist": {}, "samples": deque(maxlen=self.max_samples)}
+        ms = max(0.0, seconds * 1000.0)
+        label = bucket_label(ms)
+        entry["hist"][label] = entry["hist"].get(label, 0) + 1
+        entry["samples"].append(ms)
+
+    def summary(self):
+        out = {}
+        for group, stages in self.groups.items():
+            out[group] = {}
+            for stage in STAGES:
+                entry = stages.get(stage)
+                if entry is None:
+                    continue
+                samples = sorted(entry["samples"])
+                n = len(samples)
+                out[group][stage] = {
+                    "count": sum(entry["hist"].values()),
+                    "p50_ms": round(samples[n // 2], 2),
+                    "p95_ms": round(samples[min(n - 1, int(n * 0.95))], 2),
+                    "max_ms": round(samples[-1], 2),
+                    "histogram": entry["hist"],
+                }
+        return out
+
+    def write_report(self, path=LATENCY_REPORT_PATH):
+        if not self.enabled or not self.groups:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.summary(), f, indent=2)
+        except Exception:
+            pass
@@ -8,6 +8,7 @@
 # score_to_stars() zet score om naar sterren
 
 # schedule_next_check() regelt de timing wanneer de baas komt checken
+# (audio_latency: de voetstappen starten zoveel eerder, zodat ze op tijd hoorbaar zijn)
 
 import random
 from config import STAR_1, STAR_2, STAR_3, MAX_HOLD_BONUS
@@ -53,8 +54,9 @@ def score_to_stars(score_int: int, level_num: int) -> int:
         return 1
     return 0
 
-def schedule_next_check(play_state, params):
+def schedule_next_check(play_state, params, audio_latency=0.0):
     BOSS_SOUND_START_OFFSET = 0.5
     play_state["next_check_in"] = random.uniform(params["min_wait"], params["max_wait"]) - BOSS_SOUND_START_OFFSET
     play_state["next_check_in"] = max(0.1, play_state["next_check_in"])
+    play_state["pre_walk_sound_at"] = max(0.0, play_state["next_check_in"] - audio_latency)
     play_state["pre_walk_sound_started"] = False
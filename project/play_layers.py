@@ -0,0 +1,102 @@
+# play_layers.py
+# Vooraf samengestelde statische lagen voor de PLAY-scene.
+
+# Achtergrond, bureau en laptop veranderen niet tijdens het spelen, dus die worden één keer
+# samengevoegd tot play_static_s (opaak, schermgrootte)
+
+# play_front_s = alleen bureau + laptop (met alpha), zodat de baas er netjes achter kan lopen:
+# static, dan de baas, dan het stukje front dat over de baas valt
+
+# get_play_layers() bouwt ze bij de eerste PLAY-frame; de cache zit in de layers-dict zelf
+# (game.layout of de verkleinde PostFX-set)
+
+# get_play_atlas() pakt de sprites die per frame wisselen (handen, joint, telefoon en de baas
+# van de gevraagde levels, al op de juiste grootte) in één atlas; boss_atlas_name() geeft de naam
+# Een verkleinde atlas (PostFX, k < 1) schaalt de baas uit de gewone atlas (base) i.p.v. de
+# bron opnieuw te decoderen; PlayScene.enter() bouwt beide vóór het eerste frame
+
+# invalidate_play_layers() bij recalc_layout en bij het equippen van een andere skin
+import pygame
+from assets import BOSS_LEVELS, boss_key_for_level, boss_size
+from atlas import build_atlas
+from sprites import blit_sprite, sprite_rect
+from utils import scale
+
+CACHE_KEYS = ("play_static_s", "play_front_s", "play_front_rect", "play_atlas", "play_atlas_bosses")
+ATLAS_KEYS = ("hands_0_s", "hands_1_s", "smoking_hand_s", "phone_skin_s")
+
+def invalidate_play_layers(layers):
+    for key in CACHE_KEYS:
+        layers.pop(key, None)
+
+def _build(layers, layout, k):
+    bg = layers["background_s"]
+    desk = layers["desk_s"]
+    laptop = layers["laptop_nohands_s"]
+    desk_pos = (int(layout["DESK_POS"][0] * k), int(layout["DESK_POS"][1] * k))
+    laptop_pos = (int(layout["LAPTOP_POS"][0] * k), int(layout["LAPTOP_POS"][1] * k))
+
+    static = pygame.Surface(bg.get_size()).convert()
+    static.blit(bg, (0, 0))
+    blit_sprite(static, desk, desk_pos)
+    blit_sprite(static, laptop, laptop_pos)
+
+    front_rect = sprite_rect(desk, desk_pos).union(sprite_rect(laptop, laptop_pos))
+    front = pygame.Surface(front_rect.size, pygame.SRCALPHA).convert_alpha()
+    blit_sprite(front, desk, (desk_pos[0] - front_rect.x, desk_pos[1] - front_rect.y))
+    blit_sprite(front, laptop, (laptop_pos[0] - front_rect.x, laptop_pos[1] - front_rect.y))
+
+    layers["play_static_s"] = static
+    layers["play_front_s"] = front
+    layers["play_front_rect"] = front_rect
+
+def get_play_layers(layers, layout, k=1.0):
+    if layers.get("play_static_s") is None:
+        _build(layers, layout, k)
+    return layers["play_static_s"], layers["play_front_s"], layers["play_front_rect"]
+
+def boss_atlas_name(level_num, w, h):
+    return f"{boss_key_for_level(level_num)}:{int(w)}x{int(h)}"
+
+def boss_groups(levels):
+    # één level per boss-groep (de sprites en groottes zijn per groep gelijk)
+    groups = {}
+    for level in levels:
+        groups.setdefault(boss_key_for_level(level), level)
+    return tuple(sorted(groups.values()))
+
+def _build_atlas(layers, layout, img, levels, k, base):
+    sprites = {key: layers.get(key) for key in ATLAS_KEYS}
+    boss_keys = set()
+    for level in levels:
+        key = boss_key_for_level(level)
+        for t in (0.0, 1.0):
+            bw, bh = boss_size(layout, level, t)
+            name = boss_atlas_name(level, bw * k, bh * k)
+            if name in sprites:
+                continue
+            full_name = boss_atlas_name(level, bw, bh)
+            if base is not None and full_name in base:
+                sprites[name] = scale(base.surface.subsurface(base.rect(full_name)), bw * k, bh * k)
+            else:
+                sprites[name] = scale(img[key], bw * k, bh * k)
+                boss_keys.add(key)
+    for key in boss_keys:
+        img.drop(key)
+    return build_atlas(sprites)
+
+def get_play_atlas(layers, layout, img, levels=BOSS_LEVELS, k=1.0, base=None):
+    # levels: levels waarvan de baas erin moet; base: de atlas op k = 1 (voor k < 1)
+    levels = boss_groups(levels)
+    if layers.get("play_atlas") is None or layers.get("play_atlas_bosses") != levels:
+        layers["play_atlas"] = _build_atlas(layers, layout, img, levels, k, base)
+        layers["play_atlas_bosses"] = levels
+    return layers["play_atlas"]
+
+def blit_front_over(target, front, front_rect, rect, ox=0, oy=0):
+    # alleen het deel van bureau/laptop dat over rect (bv. de baas) valt opnieuw tekenen
+    overlap = front_rect.clip(rect)
+    if overlap.w <= 0 or overlap.h <= 0:
+        return
+    area = overlap.move(-front_rect.x, -front_rect.y)
+    target.blit(front, (overlap.x + ox, overlap.y + oy), area)
@@ -0,0 +1,120 @@
+# postfx.py
+# Post-processing voor het "high"-effect (na de joint).
+
+# PostFX houdt één offscreen buffer bij (HIGH_FX_SCALE x schermgrootte, maar nooit groter dan
+# HIGH_FX_MAX_SIZE); de play-wereld wordt daar één keer in getekend, met de shake als offset
+# fx_scale ligt vast bij het maken (schermgrootte verandert niet), zodat enter() en draw()
+# dezelfde k gebruiken
+
+# layers() geeft verkleinde kopieën van de layout-surfaces voor die buffer (gecached,
+# opnieuw geschaald zodra de layout/skin verandert)
+
+# tint() blit een vaste gekleurde overlay i.p.v. elke frame een nieuwe full-screen Surface
+# wobble() verschuift horizontale stroken (sinus), present() schaalt de buffer naar het scherm
+# (smooth: smoothscale, anders nearest; smoothscale kost op 1080p een paar ms per frame, dus de
+# quality governor zet het op low/minimal uit)
+# clear() geeft buffer en kopieën vrij (bij het verlaten van play)
+import math
+import pygame
+from config import HIGH_FX_SCALE, HIGH_FX_MAX_SIZE, HIGH_FX_WOBBLE_PX
+from play_layers import invalidate_play_layers
+from utils import scale
+
+LAYER_KEYS = ("background_s", "desk_s", "laptop_nohands_s", "hands_0_s", "hands_1_s",
+              "smoking_hand_s", "phone_skin_s")
+
+class PostFX:
+    def __init__(self, screen_size=None, fx_scale=HIGH_FX_SCALE, max_size=HIGH_FX_MAX_SIZE,
+                 wobble_px=HIGH_FX_WOBBLE_PX):
+        self.fx_scale = capped_scale(screen_size, fx_scale, max_size)
+        self.wobble_px = wobble_px
+        self.buffer = None
+        self._wobble_src = None
+        self._tint = None
+        self._tint_color = None
+        self._layers = {}
+        self._layer_src = {}   # key -> layout-surface waar de verkleinde kopie van gemaakt is
+
+    def buffer_for(self, size):
+        w, h = size
+        bw, bh = max(1, int(w * self.fx_scale)), max(1, int(h * self.fx_scale))
+        if self.buffer is None or self.buffer.get_size() != (bw, bh):
+            # zonder alpha: blits en fills naar de buffer zijn dan het goedkoopst
+            self.buffer = pygame.Surface((bw, bh)).convert()
+            self._wobble_src = None
+        return self.buffer
+
+    def layers(self, layout):
+        if self.fx_scale == 1.0:
+            return layout
+        k = self.fx_scale
+        for key in LAYER_KEYS:
+            src = layout.get(key)
+            if self._layer_src.get(key, False) is src:
+                continue
+            if src is None:
+                self._layers[key] = None
+            else:
+                # bij een TrimmedSurface gaat scale() over de volledige sprite-grootte
+                w, h = getattr(src, "full_size", src.get_size())
+                self._layers[key] = scale(src, w * k, h * k)
+            self._layer_src[key] = src
+            invalidate_play_layers(self._layers)
+        return self._layers
+
+    def clear(self):
+        # alles vrijgeven (bij het verlaten van play); wordt bij gebruik opnieuw aangemaakt
+        self.buffer = None
+        self._wobble_src = None
+        self._tint = None
+        self._tint_color = None
+        self._layers.clear()
+        self._layer_src.clear()
+
+    def tint(self, buf, color, alpha=50):
+        # vaste overlay in buffergrootte, alleen opnieuw gevuld als de kleur wisselt
+        # (een alpha-blit is veel sneller dan BLEND_RGB_MULT/ADD-fills)
+        if self._tint is None or self._tint.get_size() != buf.get_size():
+            self._tint = pygame.Surface(buf.get_size()).convert()
+            self._tint_color = None
+        if self._tint_color != (color, alpha):
+            self._tint.fill(color)
+            self._tint.set_alpha(alpha)
+            self._tint_color = (color, alpha)
+        buf.blit(self._tint, (0, 0))
+
+    def wobble(self, buf, phase, band=8):
+        amp = self.wobble_px * self.fx_scale
+        if amp < 1:
+            return
+        if self._wobble_src is None or self._wobble_src.get_size() != buf.get_size():
+            self._wobble_src = buf.copy()
+        else:
+            self._wobble_src.blit(buf, (0, 0))
+        w, h = buf.get_size()
+        for y in range(0, h, band):
+            dx = int(amp * math.sin(phase * 6.0 + y * 0.05))
+            buf.blit(self._wobble_src, (dx, y), (0, y, w, band))
+
+    def present(self, buf, screen, smooth=True):
+        if buf.get_size() == screen.get_size():
+            screen.blit(buf, (0, 0))
+            return
+        if smooth:
+            try:
+                pygame.transform.smoothscale(buf, screen.get_size(), screen)
+                return
+            except (ValueError, pygame.error):
+                pass   # smoothscale wil 24/32-bit surfaces
+        pygame.transform.scale(buf, screen.get_size(), screen)
+
+def clamp_scale(fx_scale):
+    return min(1.0, max(0.1, float(fx_scale)))
+
+def capped_scale(screen_size, fx_scale=HIGH_FX_SCALE, max_size=HIGH_FX_MAX_SIZE):
+    # fx_scale, maar zo dat de buffer binnen max_size past
+    k = clamp_scale(fx_scale)
+    if screen_size and max_size:
+        w, h = screen_size
+        k = min(k, max_size[0] / max(1, w), max_size[1] / max(1, h))
+    return clamp_scale(k)
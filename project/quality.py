@@ -0,0 +1,74 @@
+# quality.py
+# Past de grafische kwaliteit aan op basis van de frametijd.
+
+# QualityGovernor houdt de gemiddelde werktijd per frame bij (update + tekenen, zonder het
+# wachten op het volgende frame) over de laatste QUALITY_WINDOW frames
+
+# Boven QUALITY_DOWN_AT x framebudget gaat er een niveau omlaag, onder QUALITY_UP_AT weer
+# omhoog; na elke wissel wacht hij een tijd (omhoog langer dan omlaag) zodat hij niet blijft pendelen
+
+# flag() vertelt de tekencode wat er op dit niveau aan staat (schaduwen, overlays, ...)
+# decisions bevat de laatste QUALITY_HISTORY wissels (voor logging), changes telt ze allemaal;
+# QUALITY_LOG print ze ook meteen
+import time
+from collections import deque
+from config import (
+    FPS, QUALITY_GOVERNOR, QUALITY_START, QUALITY_WINDOW,
+    QUALITY_DOWN_AT, QUALITY_UP_AT, QUALITY_LOG, QUALITY_HISTORY,
+)
+
+# van duur naar goedkoop
+QUALITY_LEVELS = (
+    ("high",    {"panel_shadows": True,  "menu_overlays": True,  "high_wobble": True,  "high_tint": True,  "high_smooth": True}),
+    ("medium",  {"panel_shadows": True,  "menu_overlays": True,  "high_wobble": False, "high_tint": True,  "high_smooth": True}),
+    ("low",     {"panel_shadows": False, "menu_overlays": False, "high_wobble": False, "high_tint": True,  "high_smooth": False}),
+    ("minimal", {"panel_shadows": False, "menu_overlays": False, "high_wobble": False, "high_tint": False, "high_smooth": False}),
+)
+QUALITY_NAMES = tuple(name for name, _ in QUALITY_LEVELS)
+
+class QualityGovernor:
+    def __init__(self, fps=FPS, enabled=QUALITY_GOVERNOR, start=QUALITY_START, window=QUALITY_WINDOW):
+        self.enabled = enabled
+        self.budget = 1.0 / fps
+        self.level = QUALITY_NAMES.index(start) if start in QUALITY_NAMES else 0
+        self.window = max(1, int(window))
+        self.samples = deque(maxlen=self.window)
+        self.since_change = 0
+        self.decisions = deque(maxlen=QUALITY_HISTORY)   # dicts: t, from, to, avg_ms
+        self.changes = 0
+
+    @property
+    def name(self):
+        return QUALITY_NAMES[self.level]
+
+    def flag(self, key):
+        return QUALITY_LEVELS[self.level][1][key]
+
+    def on_frame(self, work_seconds):
+        if not self.enabled:
+            return
+        self.samples.append(work_seconds)
+        self.since_change += 1
+        if len(self.samples) < self.window:
+            return
+        avg = sum(self.samples) / len(self.samples)
+        if avg > self.budget * QUALITY_DOWN_AT and self.since_change >= self.window:
+            if self.level < len(QUALITY_LEVELS) - 1:
+                self._set(self.level + 1, avg)
+        elif avg < self.budget * QUALITY_UP_AT and self.since_change >= self.window * 4:
+            if self.level > 0:
+                self._set(self.level - 1, avg)
+
+    def _set(self, level, avg):
+        decision = {"t": time.perf_counter(), "from": self.name, "to": QUALITY_NAMES[level],
+                    "avg_ms": round(avg * 1000, 2)}
+        self.level = level
+        self.since_change = 0
+        self.samples.clear()
+        self.decisions.append(decision)
+        self.changes += 1
+        if QUALITY_LOG:
+            print("quality: {from} -> {to} (frame {avg_ms} ms)".format(**decision))
+
+    def status(self):
+        return f"quality={self.name} changes={self.changes}"
@@ -0,0 +1,66 @@
+# render_queue.py
+# Verzamelt draw-commando's en tekent ze per laag in zo min mogelijk calls.
+
+# RenderQueue.blit() heeft dezelfde vorm als Surface.blit (surface, dest, area, flags), dus
+# bestaande helpers (draw_text, blit_sprite, Atlas.blit) kunnen direct naar de queue tekenen
+
+# draw() zet een functie in de queue voor alles wat geen blit is (rects, lijnen): fn(target)
+
+# flush() sorteert op laag (binnen een laag blijft de volgorde gelijk) en tekent elke reeks
+# opeenvolgende blits met één Surface.blits call; stats telt submits/calls per frame
+import pygame
+
+LAYER_WORLD = 0
+LAYER_CARDS = 10
+LAYER_THUMBS = 11
+LAYER_HUD = 20
+
+class RenderQueue:
+    def __init__(self):
+        self.layer = LAYER_WORLD   # laag voor blits zonder expliciete laag
+        self._items = []           # (laag, volgnummer, blit-tuple of functie)
+        self.stats = {"submitted": 0, "blits_calls": 0, "draw_fns": 0}   # laatste flush
+        self.totals = {"submitted": 0, "blits_calls": 0, "draw_fns": 0, "flushes": 0}
+
+    def __len__(self):
+        return len(self._items)
+
+    def blit(self, surf, dest, area=None, special_flags=0, layer=None):
+        layer = self.layer if layer is None else layer
+        self._items.append((layer, len(self._items), (surf, dest, area, special_flags)))
+
+    def draw(self, fn, layer=None):
+        layer = self.layer if layer is None else layer
+        self._items.append((layer, len(self._items), fn))
+
+    def clear(self):
+        self._items.clear()
+        self.layer = LAYER_WORLD
+
+    def flush(self, target):
+        stats = {"submitted": len(self._items), "blits_calls": 0, "draw_fns": 0}
+        batch = []
+        for _, _, item in sorted(self._items, key=lambda i: (i[0], i[1])):
+            if callable(item):
+                if batch:
+                    target.blits(batch, doreturn=False)
+                    stats["blits_calls"] += 1
+                    batch = []
+                item(target)
+                stats["draw_fns"] += 1
+            else:
+                batch.append(item)
+        if batch:
+            target.blits(batch, doreturn=False)
+            stats["blits_calls"] += 1
+        self.clear()
+
+        self.stats = stats
+        for key, n in stats.items():
+            self.totals[key] += n
+        self.totals["flushes"] += 1
+
+def rect_fn(color, rect, width=0, border_radius=0):
+    # draw-functie voor RenderQueue.draw()
+    rect = pygame.Rect(rect)
+    return lambda target: pygame.draw.rect(target, color, rect, width, border_radius=border_radius)
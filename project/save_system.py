@@ -7,6 +7,9 @@
 
 # write_save() schrijft naar save.json
 
+# write_save_steps() is hetzelfde als taak voor de TaskScheduler (tasks.py), via een .tmp
+# bestand zodat save.json nooit half geschreven is
+
 import json
 import os
 from config import SAVE_PATH, TOTAL_LEVELS, SHOP_ITEMS
@@ -79,3 +82,16 @@ def write_save(data):
             json.dump(data, f, indent=2)
     except Exception:
         pass
+
+def write_save_steps(data):
+    # pas bij de eerste stap serialiseren: dan komt de nieuwste stand in het bestand
+    yield
+    text = json.dumps(data, indent=2)
+    yield
+    tmp = SAVE_PATH + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, SAVE_PATH)
+    except Exception:
+        pass
@@ -0,0 +1,60 @@
+# scenes/__init__.py
+# Scene-registry: elke scene is een eigen module met een Scene-klasse (scenes/base.py).
+
+# Een scene-module wordt pas geïmporteerd als de scene voor het eerst nodig is
+# switch() roept exit() van de vorige en enter() van de nieuwe scene aan (main.py)
+# update() / draw() gaan naar de scene in game.scene
+
+# Niet-scene helpers: scenes.run (start_level, start_highscore), scenes.play (update_play,
+# draw_play_world)
+import importlib
+
+from constants import (
+    SCENE_MAIN_MENU, SCENE_LEVEL_SELECT, SCENE_PLAY, SCENE_COMPLETE, SCENE_GAMEOVER, SCENE_SHOP
+)
+
+SCENE_CLASSES = {
+    SCENE_MAIN_MENU: ("scenes.main_menu", "MainMenuScene"),
+    SCENE_LEVEL_SELECT: ("scenes.level_select", "LevelSelectScene"),
+    SCENE_SHOP: ("scenes.shop", "ShopScene"),
+    SCENE_PLAY: ("scenes.play", "PlayScene"),
+    SCENE_COMPLETE: ("scenes.complete", "CompleteScene"),
+    SCENE_GAMEOVER: ("scenes.gameover", "GameOverScene"),
+}
+
+
+class SceneRegistry:
+    def __init__(self, classes=SCENE_CLASSES):
+        self.classes = classes
+        self._scenes = {}     # naam -> Scene (alleen scenes die al gebruikt zijn)
+        self.current = None   # scene waarvan enter() als laatste gedraaid heeft
+
+    def get(self, name):
+        scene = self._scenes.get(name)
+        if scene is None:
+            module_name, class_name = self.classes[name]
+            scene = getattr(importlib.import_module(module_name), class_name)()
+            self._scenes[name] = scene
+        return scene
+
+    def loaded(self):
+        return list(self._scenes)
+
+    def switch(self, game, name):
+        previous = self.current
+        if previous is not None:
+            self.get(previous).exit(game, name)
+        self.current = name
+        self.get(name).enter(game, previous)
+
+    def close(self, game):
+        # bij afsluiten: exit() van de huidige scene (bv. shop-thumbs wegschrijven)
+        if self.current is not None:
+            self.get(self.current).exit(game, None)
+            self.current = None
+
+    def update(self, game, dt):
+        self.get(game.scene).update(game, dt)
+
+    def draw(self, game, click):
+        self.get(game.scene).draw(game, click)
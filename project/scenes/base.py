@@ -0,0 +1,23 @@
+# scenes/base.py
+# Basisklasse voor alle scenes.
+
+# enter() bij het binnenkomen (assets klaarzetten, geluid), exit() bij het verlaten
+# (scene-specifieke caches vrijgeven); previous/next_scene is de naam van de andere scene
+
+# update() alleen voor scenes met spel-logica, draw() tekent + verwerkt klikken
+
+
+class Scene:
+    name = None
+
+    def enter(self, game, previous):
+        pass
+
+    def exit(self, game, next_scene):
+        pass
+
+    def update(self, game, dt):
+        pass
+
+    def draw(self, game, click):
+        pass
@@ -0,0 +1,52 @@
+# scenes/gameover.py
+# Betrapt: retry (level of highscore) of terug naar de levels.
+
+import pygame
+
+from constants import SCENE_LEVEL_SELECT, SCENE_PLAY, SCENE_GAMEOVER
+from scenes.base import Scene
+from scenes.run import start_level, start_highscore
+from scenes.play import release_play
+
+
+class GameOverScene(Scene):
+    name = SCENE_GAMEOVER
+
+    def enter(self, game, previous):
+        game.snd["game_over"].play()
+
+    def exit(self, game, next_scene):
+        if next_scene != SCENE_PLAY:
+            release_play(game)
+
+    def draw(self, game, click):
+        screen = game.screen
+
+        if game.img["HAS_CAUGHT_BG"] and game.layout["caught_bg"] is not None:
+            screen.blit(game.layout["caught_bg"], (0, 0))
+            if game.quality.flag("menu_overlays"):
+                overlay = pygame.Surface((game.WIDTH, game.HEIGHT), pygame.SRCALPHA)
+                overlay.fill((0, 0, 0, 70))
+                screen.blit(overlay, (0, 0))
+        else:
+            screen.fill((25, 25, 25))
+
+        bw, bh = int(game.WIDTH * 0.33), int(game.HEIGHT * 0.12)
+        bx = game.WIDTH // 2 - bw // 2
+
+        retry_rect = pygame.Rect(bx, int(game.HEIGHT * 0.66), bw, bh)
+
+        # In highscore mode: retry = opnieuw highscore starten
+        if game.mode == "highscore":
+            if game.menu_button(retry_rect, "RETRY (HIGHSCORE)") and click:
+                start_highscore(game)
+        else:
+            if game.menu_button(retry_rect, "RETRY") and click:
+                start_level(game, game.last_run_level)
+
+        back_rect = pygame.Rect(bx, int(game.HEIGHT * 0.80), bw, bh)
+        if game.menu_button(back_rect, "TERUG NAAR LEVELS") and click:
+            game.scene = SCENE_LEVEL_SELECT
+
+        hint = game.small.render("ESC = hoofdmenu", True, (255, 255, 255))
+        screen.blit(hint, (game.WIDTH // 2 - hint.get_width() // 2, game.HEIGHT - int(game.HEIGHT * 0.06)))
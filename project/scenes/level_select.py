@@ -0,0 +1,101 @@
+# scenes/level_select.py
+# Level select: grid met alle levels (sterren, lock) + knop naar de shop.
+
+import pygame
+
+from config import GRID_COLS, GRID_ROWS, TOTAL_LEVELS
+from constants import SCENE_MAIN_MENU, SCENE_LEVEL_SELECT, SCENE_SHOP
+from utils import draw_text
+from scenes.base import Scene
+from scenes.run import start_level
+
+
+class LevelSelectScene(Scene):
+    name = SCENE_LEVEL_SELECT
+
+    def draw(self, game, click):
+        screen = game.screen
+        mx, my = pygame.mouse.get_pos()
+
+        if game.img.get("HAS_LEVEL_SELECT_BG", False) and game.layout.get("level_select_bg") is not None:
+            screen.blit(game.layout["level_select_bg"], (0, 0))
+
+            if game.quality.flag("menu_overlays"):
+                overlay = pygame.Surface((game.WIDTH, game.HEIGHT), pygame.SRCALPHA)
+                overlay.fill((0, 0, 0, 64))
+                screen.blit(overlay, (0, 0))
+
+                header_overlay = pygame.Surface((game.WIDTH, int(game.HEIGHT * 0.22)), pygame.SRCALPHA)
+                header_overlay.fill((0, 0, 0, 128))
+                screen.blit(header_overlay, (0, 0))
+        else:
+            pygame.draw.rect(screen, (170, 210, 240), (0, 0, game.WIDTH, int(game.HEIGHT * 0.30)))
+            pygame.draw.rect(
+                screen,
+                (120, 180, 230),
+                (0, int(game.HEIGHT * 0.30), game.WIDTH, game.HEIGHT - int(game.HEIGHT * 0.30)),
+            )
+
+        back_rect = pygame.Rect(int(game.WIDTH * 0.02), int(game.HEIGHT * 0.03),
+                                int(game.WIDTH * 0.12), int(game.HEIGHT * 0.07))
+        if game.button(back_rect, "< Terug") and click:
+            game.scene = SCENE_MAIN_MENU
+
+        draw_text(screen, game.font, f"Unlocked: {game.save['unlocked']} / {TOTAL_LEVELS}",
+                  int(game.WIDTH * 0.04), int(game.HEIGHT * 0.18), (255, 255, 255))
+        draw_text(screen, game.font, f"Coins: {game.save['coins']}",
+                  int(game.WIDTH * 0.82), int(game.HEIGHT * 0.18), (255, 255, 255))
+
+        shop_btn = pygame.Rect(int(game.WIDTH * 0.79), int(game.HEIGHT * 0.04),
+                               int(game.WIDTH * 0.17), int(game.HEIGHT * 0.09))
+        if game.button(shop_btn, "SHOP") and click:
+            game.scene = SCENE_SHOP
+
+        TILE_W = game.layout["TILE_W"]
+        TILE_H = game.layout["TILE_H"]
+        GRID_TOP = game.layout["GRID_TOP"]
+        GRID_LEFT = game.layout["GRID_LEFT"]
+
+        for r in range(GRID_ROWS):
+            for c in range(GRID_COLS):
+                idx = r * GRID_COLS + c
+                lvl_num = idx + 1
+                x = GRID_LEFT + c * TILE_W
+                y = GRID_TOP + r * TILE_H
+                rect = pygame.Rect(
+                    x + int(TILE_W * 0.07),
+                    y + int(TILE_H * 0.10),
+                    int(TILE_W * 0.86),
+                    int(TILE_H * 0.78)
+                )
+
+                unlocked = lvl_num <= game.save["unlocked"]
+                hover = rect.collidepoint(mx, my)
+
+                if unlocked:
+                    fill = (245, 230, 160) if hover else (240, 220, 140)
+                    pygame.draw.rect(screen, fill, rect, border_radius=16)
+                    pygame.draw.rect(screen, (150, 120, 70), rect, 3, border_radius=16)
+
+                    t = game.font.render(str(lvl_num), True, (55, 45, 35))
+                    screen.blit(t, (rect.x + 12, rect.y + 10))
+
+                    star_size = max(12, int((game.HEIGHT / 540) * 18))
+                    game.draw_star_row(
+                        rect.x + 18,
+                        rect.y + int(rect.h * 0.55),
+                        game.save["stars"][idx],
+                        size=star_size,
+                        gap=max(4, int(star_size * 0.35))
+                    )
+
+                    if click and hover:
+                        start_level(game, lvl_num)
+                else:
+                    fill = (200, 200, 205) if hover else (190, 190, 195)
+                    pygame.draw.rect(screen, fill, rect, border_radius=16)
+                    pygame.draw.rect(screen, (130, 130, 140), rect, 3, border_radius=16)
+                    draw_text(screen, game.font, "LOCK", rect.centerx - 22, rect.centery - 12, (90, 90, 100))
+
+        draw_text(screen, game.small, "Klik op een level. (ESC = hoofdmenu)",
+                  int(game.WIDTH * 0.04), game.HEIGHT - int(game.HEIGHT * 0.06), (255, 255, 255))
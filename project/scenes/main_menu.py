@@ -0,0 +1,60 @@
+# scenes/main_menu.py
+# Hoofdmenu: highscore starten, level select, shop, afsluiten.
+
+import pygame
+
+from config import MAIN_MENU_BG_COLOR
+from constants import SCENE_MAIN_MENU, SCENE_LEVEL_SELECT, SCENE_SHOP
+from utils import draw_text
+from scenes.base import Scene
+from scenes.run import start_highscore
+
+
+class MainMenuScene(Scene):
+    name = SCENE_MAIN_MENU
+
+    def draw(self, game, click):
+        screen = game.screen
+
+        if game.img["HAS_MENU_BG"] and game.layout["main_menu_bg"] is not None:
+            screen.blit(game.layout["main_menu_bg"], (0, 0))
+            if game.quality.flag("menu_overlays"):
+                overlay = pygame.Surface((game.WIDTH, game.HEIGHT))
+                overlay.set_alpha(64)
+                overlay.fill((0, 0, 0))
+                screen.blit(overlay, (0, 0))
+        else:
+            screen.fill(MAIN_MENU_BG_COLOR)
+            for i in range(0, game.WIDTH, 40):
+                for j in range(0, game.HEIGHT, 40):
+                    pygame.draw.rect(screen, (35, 45, 60), (i, j, 40, 40), 1)
+
+        button_width = int(game.WIDTH * 0.32)
+        button_height = int(game.HEIGHT * 0.11)
+        button_x = game.WIDTH // 2 - button_width // 2
+
+        start_rect = pygame.Rect(button_x, int(game.HEIGHT * 0.33), button_width, button_height)
+        if game.menu_button(start_rect, "START GAME") and click:
+            start_highscore(game)
+
+        levels_rect = pygame.Rect(button_x, int(game.HEIGHT * 0.48), button_width, button_height)
+        if game.menu_button(levels_rect, "LEVEL SELECT") and click:
+            game.scene = SCENE_LEVEL_SELECT
+
+        shop_rect = pygame.Rect(button_x, int(game.HEIGHT * 0.63), button_width, button_height)
+        if game.menu_button(shop_rect, "SHOP") and click:
+            game.scene = SCENE_SHOP
+
+        quit_rect = pygame.Rect(button_x, int(game.HEIGHT * 0.78), button_width, button_height)
+        if game.menu_button(quit_rect, "QUIT GAME") and click:
+            game.running = False
+
+        footer_text = game.small.render("SPATIE = telefoon | ESC = menu", True, (0, 0, 0))
+        screen.blit(
+            footer_text,
+            (game.WIDTH // 2 - footer_text.get_width() // 2, game.HEIGHT - int(game.HEIGHT * 0.06)),
+        )
+
+        # (optioneel) highscore tonen
+        hs = int(game.save.get("highscore", 0))
+        draw_text(screen, game.small, f"Highscore: {hs}", int(game.WIDTH*0.04), int(game.HEIGHT*0.90), (255,255,255))
@@ -0,0 +1,396 @@
+# scenes/play.py
+# Play-scene: update_play() (baas, score, complete/gameover) en het tekenen van de wereld + HUD.
+
+# draw_play_world() tekent alles behalve de HUD naar een target (scherm, fx-buffer of render queue)
+# enter() decodeert de play-loops en bouwt de play-lagen en de sprite-atlas op,
+# release_play() geeft de lagen weer vrij
+
+import random
+import pygame
+
+from config import (
+    TOTAL_LEVELS, COINS_BASE_WIN, COINS_PER_STAR, COINS_FIRST_CLEAR_BONUS, POPUP_DURATION,
+    MAX_HOLD_BONUS, PHONE_POINTS_PER_SEC,
+)
+from constants import (
+    SCENE_PLAY, SCENE_COMPLETE, SCENE_GAMEOVER, WAIT, WALKING_IN, LOOKING, WALKING_OUT,
+)
+from utils import draw_text, clamp, scale
+from levels import (
+    make_level_params, schedule_next_check, score_to_stars, level_star_thresholds,
+    level_complete_score,
+)
+from save_system import write_save_steps
+from assets import BOSS_LEVELS, boss_asset_for_level, boss_size
+from render_queue import LAYER_HUD, rect_fn
+from play_layers import (
+    get_play_layers, get_play_atlas, boss_atlas_name, blit_front_over, invalidate_play_layers,
+)
+from audio import PLAY_LOOPS, prewarm_sounds
+from scenes.base import Scene
+
+
+# -----------------------------
+# Boss path helper
+# -----------------------------
+def set_boss_path(game, direction="in"):
+    if direction == "in":
+        from_left = random.choice([True, False])
+        start_x = -80 if from_left else game.WIDTH + 80
+        end_x = game.layout["LAPTOP_POS"][0] + game.layout["LAPTOP_SIZE"][0] // 2
+        game.play["boss_start"] = (start_x, game.layout["BOSS_START_Y"])
+        game.play["boss_end"] = (end_x, game.layout["BOSS_END_Y"])
+        game.play["boss_from_left"] = from_left
+    else:
+        from_left = game.play.get("boss_from_left", True)
+        start_x = game.layout["LAPTOP_POS"][0] + game.layout["LAPTOP_SIZE"][0] // 2
+        end_x = -80 if from_left else game.WIDTH + 80
+        game.play["boss_start"] = (start_x, game.layout["BOSS_START_Y"])
+        game.play["boss_end"] = (end_x, game.layout["BOSS_END_Y"])
+
+
+def chatter_sound(game):
+    return "boss3_chatter" if game.selected_level >= 10 else "boss_chatter"
+
+
+# -----------------------------
+# Update logic for play scene
+# -----------------------------
+def update_play(game, dt):
+    # difficulty
+    if game.mode == "highscore":
+        dynamic_level = min(TOTAL_LEVELS, 1 + int(game.play["score"] // 500))
+        game.selected_level = dynamic_level
+        params = make_level_params(dynamic_level - 1)
+        # Make boss faster every 500 points
+        milestone = int(game.play["score"] // 500)
+        speed_factor = 1.0 + milestone * 0.1  # 10% faster each milestone
+        params["walk_in"] = max(0.4, params["walk_in"] / speed_factor)
+        params["walk_out"] = max(0.4, params["walk_out"] / speed_factor)
+    else:
+        params = make_level_params(game.selected_level - 1)
+
+    # hands animation
+    if not game.play["phone"] and not game.play.get("smoking", False):
+        game.play["hands_anim_t"] += dt
+        if game.play["hands_anim_t"] >= 0.15:
+            game.play["hands_anim_t"] -= 0.15
+            game.play["hands_anim_frame"] = 1 - game.play["hands_anim_frame"]
+    else:
+        game.play["hands_anim_t"] = 0.0
+        game.play["hands_anim_frame"] = 0
+
+    # phone scoring
+    if game.play["phone"]:
+        game.play["phone_hold_time"] += dt
+        combo_curve_exponent = 0.5
+        raw_bonus = 1.0 + (game.play["phone_hold_time"] ** combo_curve_exponent)
+        hold_bonus = min(raw_bonus, MAX_HOLD_BONUS)
+        high_bonus = 1.2 if game.play.get("high_timer", 0) > 0 else 1.0
+        game.play["score"] += PHONE_POINTS_PER_SEC * hold_bonus * params["mult"] * high_bonus * dt
+    else:
+        game.play["phone_hold_time"] = 0.0
+
+    # smoking -> high (als aanwezig)
+    if "smoking" in game.play:
+        if game.play["smoking"]:
+            game.play["smoking_timer"] += dt
+            if game.play["smoking_timer"] >= 5.0:
+                game.play["smoking"] = False
+                game.play["high_timer"] = 15.0
+                game.set_popup("Joint smoked! You're high!", POPUP_DURATION)
+        else:
+            game.play["smoking_timer"] = 0.0
+
+        # high effects
+        if game.play["high_timer"] > 0:
+            game.play["high_timer"] -= dt
+            game.play["shake_x"] = random.randint(-15, 15)
+            game.play["shake_y"] = random.randint(-15, 15)
+
+            game.play["hallucination_timer"] += dt
+            if game.play["hallucination_timer"] >= 1.0:
+                game.play["hallucination_timer"] -= 1.0
+                game.play["hallucination_color"] = (
+                    random.randint(0, 255),
+                    random.randint(0, 255),
+                    random.randint(0, 255),
+                )
+        else:
+            game.play["shake_x"] = 0
+            game.play["shake_y"] = 0
+            game.play["hallucination_color"] = (0, 255, 0)
+            game.play["hallucination_timer"] = 0.0
+
+    # boss timing/state machine
+    game.play["boss_timer"] += dt
+
+    if game.play["boss_state"] == WAIT:
+        if game.play["boss_timer"] >= game.play["pre_walk_sound_at"] and not game.play["pre_walk_sound_started"]:
+            game.loops.play("boss_walk")
+            game.play["pre_walk_sound_started"] = True
+
+        if game.play["boss_timer"] >= game.play["next_check_in"] + 0.5:
+            game.play["boss_timer"] = 0.0
+            game.play["boss_state"] = WALKING_IN
+            game.play["reaction_timer"] = 0.0
+            game.play["caught"] = False
+            set_boss_path(game, direction="in")
+
+    elif game.play["boss_state"] == WALKING_IN:
+        game.play["reaction_timer"] += dt
+        if (game.play["phone"] or game.play.get("smoking", False)) and game.play["reaction_timer"] > params["grace"]:
+            game.play["caught"] = True
+            game.play["gameover"] = True
+
+        if game.play["boss_timer"] >= params["walk_in"]:
+            game.play["boss_timer"] = 0.0
+            game.play["boss_state"] = LOOKING
+            game.loops.stop("boss_walk")
+            game.loops.play(chatter_sound(game))
+
+    elif game.play["boss_state"] == LOOKING:
+        if game.play["phone"] or game.play.get("smoking", False):
+            game.play["caught"] = True
+            game.play["gameover"] = True
+
+        if game.play["boss_timer"] >= params["look"]:
+            game.play["boss_state"] = WALKING_OUT
+            game.play["boss_timer"] = 0.0
+            set_boss_path(game, direction="out")
+            # gebabbel loopt gewoon door tijdens het weglopen (play() van wat al speelt doet niets)
+            game.loops.play(chatter_sound(game))
+
+    elif game.play["boss_state"] == WALKING_OUT:
+        if game.play["boss_timer"] >= params["walk_out"]:
+            game.play["boss_state"] = WAIT
+            game.play["boss_timer"] = 0.0
+            game.loops.stop("boss_walk")
+            schedule_next_check(game.play, params, game.audio_latency)
+            if not game.play["phone"] and not game.play.get("smoking", False) and not game.play["gameover"]:
+                game.loops.play("typing")
+
+    # -------------------------
+    # WIN condition (alleen in level mode)
+    # -------------------------
+    if game.mode != "highscore":
+        complete_score = level_complete_score(game.selected_level)
+        if game.play["score"] >= complete_score:
+            game.last_run_score = int(game.play["score"])
+            game.last_run_level = game.selected_level
+            game.last_run_stars = score_to_stars(game.last_run_score, game.last_run_level)
+
+            prev_stars = game.save["stars"][game.last_run_level - 1]
+            first_clear = (prev_stars == 0)
+
+            game.save["stars"][game.last_run_level - 1] = max(prev_stars, game.last_run_stars)
+            if game.last_run_level < TOTAL_LEVELS:
+                game.save["unlocked"] = max(game.save["unlocked"], game.last_run_level + 1)
+
+            game.save["coins"] += (COINS_BASE_WIN + game.last_run_stars * COINS_PER_STAR)
+            if first_clear:
+                game.save["coins"] += COINS_FIRST_CLEAR_BONUS
+
+            game.tasks.add("save", write_save_steps(game.save))
+            game.scene = SCENE_COMPLETE
+            return
+
+    # -------------------------
+    # GAME OVER
+    # -------------------------
+    if game.play["gameover"]:
+        game.last_run_score = int(game.play["score"])
+        game.last_run_level = game.selected_level
+        game.last_run_stars = score_to_stars(game.last_run_score, game.last_run_level)
+
+        # level stats alleen bewaren in level mode
+        if game.mode != "highscore":
+            prev_stars = game.save["stars"][game.last_run_level - 1]
+            game.save["stars"][game.last_run_level - 1] = max(prev_stars, game.last_run_stars)
+
+            coins_earned = game.last_run_stars * COINS_PER_STAR
+            game.save["coins"] += coins_earned
+
+        # highscore save
+        if game.mode == "highscore":
+            run_score = int(game.play["score"])
+            game.save["highscore"] = max(int(game.save.get("highscore", 0)), run_score)
+
+        game.tasks.add("save", write_save_steps(game.save))
+        game.scene = SCENE_GAMEOVER
+        return
+
+
+# -----------------------------
+# PLAY wereld (alles behalve de HUD)
+# -----------------------------
+def boss_levels(game):
+    # highscore: het level stijgt tijdens de run, dan moeten alle boss-groepen in de atlas
+    return BOSS_LEVELS if game.mode == "highscore" else (game.selected_level,)
+
+
+def play_atlas(game, layers, k=1.0):
+    # de verkleinde (PostFX) atlas schaalt de baas uit de gewone atlas, zonder te decoderen
+    levels = boss_levels(game)
+    base = None
+    if layers is not game.layout:
+        base = get_play_atlas(game.layout, game.layout, game.img, levels)
+    return get_play_atlas(layers, game.layout, game.img, levels, k, base)
+
+
+def draw_play_world(game, target, params, layers, k=1.0, ox=0, oy=0):
+    # layers: game.layout of de verkleinde kopieën uit PostFX; k = schaal van target t.o.v. het scherm
+    from config import HANDS_Y_OFFSET
+    layout = game.layout
+    static, front, front_rect = get_play_layers(layers, layout, k)
+    atlas = play_atlas(game, layers, k)
+    target.blit(static, (ox, oy))
+
+    if game.play["boss_state"] in (WALKING_IN, LOOKING, WALKING_OUT):
+        if game.play["boss_state"] == WALKING_IN:
+            t = clamp(game.play["boss_timer"] / params["walk_in"], 0.0, 1.0)
+        elif game.play["boss_state"] == WALKING_OUT:
+            t = clamp(game.play["boss_timer"] / params["walk_out"], 0.0, 1.0)
+        else:
+            t = 1.0
+
+        sx0, sy0 = game.play["boss_start"]
+        ex0, ey0 = game.play["boss_end"]
+        bx = int((sx0 + (ex0 - sx0) * t) * k)
+        by = int((sy0 + (ey0 - sy0) * t) * k)
+
+        bw, bh = boss_size(layout, game.selected_level, t)
+        name = boss_atlas_name(game.selected_level, bw * k, bh * k)
+        if name in atlas:
+            boss_rect = atlas.rect(name).copy()
+            boss_rect.center = (bx, by)
+            atlas.blit(target, name, (boss_rect.x + ox, boss_rect.y + oy))
+        else:
+            # tussenliggende grootte (BOSS_FAR != BOSS_NEAR): per frame schalen
+            boss_img = boss_asset_for_level(game.img, game.selected_level)
+            boss_scaled = scale(boss_img, bw * k, bh * k)
+            boss_rect = boss_scaled.get_rect(center=(bx, by))
+            target.blit(boss_scaled, (boss_rect.x + ox, boss_rect.y + oy))
+        # bureau + laptop staan vóór de baas
+        blit_front_over(target, front, front_rect, boss_rect, ox, oy)
+
+    LAPTOP_POS = layout["LAPTOP_POS"]
+
+    hands_pos = (
+        int(LAPTOP_POS[0] * k) + ox,
+        int((LAPTOP_POS[1] + int(HANDS_Y_OFFSET * (game.HEIGHT / 540))) * k) + oy,
+    )
+
+    if game.play["phone"]:
+        phone_pos = (int(layout["PHONE_POS"][0] * k) + ox, int(layout["PHONE_POS"][1] * k) + oy)
+        if "phone_skin_s" in atlas:
+            atlas.blit(target, "phone_skin_s", phone_pos)
+        else:
+            pw, ph = layout["PHONE_SIZE"]
+            target.blit(scale(game.img["phone_default"], pw * k, ph * k), phone_pos)
+    elif game.play.get("smoking", False):
+        if "smoking_hand_s" in atlas:
+            atlas.blit(target, "smoking_hand_s", hands_pos)
+    else:
+        atlas.blit(target, "hands_0_s" if game.play["hands_anim_frame"] == 0 else "hands_1_s", hands_pos)
+
+
+# -----------------------------
+# Caches van de play-wereld
+# -----------------------------
+# na complete/gameover komt meestal meteen een nieuwe run, dan blijven de caches staan
+PLAY_RESULT_SCENES = (SCENE_COMPLETE, SCENE_GAMEOVER)
+
+
+def release_play(game):
+    # statische lagen, sprite-atlas en de post-fx kopieën vrijgeven
+    invalidate_play_layers(game.layout)
+    game.postfx.clear()
+
+
+class PlayScene(Scene):
+    name = SCENE_PLAY
+
+    def enter(self, game, previous):
+        # een net gekochte skin moet er zijn; lagen en atlas nu opbouwen i.p.v. in het eerste frame
+        game.tasks.finish("skin:laptop", "skin:phone")
+        prewarm_sounds(game.snd, PLAY_LOOPS)
+        get_play_layers(game.layout, game.layout)
+        play_atlas(game, game.layout)
+        # ook de verkleinde set voor het high-effect, anders gebeurt dat midden in PLAY
+        fx = game.postfx
+        fx_layers = fx.layers(game.layout)
+        get_play_layers(fx_layers, game.layout, fx.fx_scale)
+        play_atlas(game, fx_layers, fx.fx_scale)
+        if not game.play["phone"] and not game.play["smoking"] and not game.play["gameover"]:
+            game.loops.play("typing")
+
+    def exit(self, game, next_scene):
+        if next_scene not in PLAY_RESULT_SCENES:
+            release_play(game)
+
+    def update(self, game, dt):
+        update_play(game, dt)
+
+    def draw(self, game, click):
+        screen = game.screen
+
+        params = make_level_params(game.selected_level - 1)
+
+        t1, t2, t3 = level_star_thresholds(game.selected_level)
+        complete_score = t3
+
+        queue = game.render_queue
+        if game.play.get("high_timer", 0) > 0:
+            # high: wereld één keer in de (kleinere) fx-buffer, effecten daar, dan naar het scherm
+            fx = game.postfx
+            buf = fx.buffer_for(screen.get_size())
+            k = fx.fx_scale   # dezelfde k als in enter(), dan kloppen de atlas-namen
+            draw_play_world(game, queue, params, fx.layers(game.layout), k,
+                            int(game.play.get("shake_x", 0) * k), int(game.play.get("shake_y", 0) * k))
+            queue.flush(buf)
+            if game.quality.flag("high_tint"):
+                fx.tint(buf, game.play.get("hallucination_color", (0, 255, 0)))
+            if game.quality.flag("high_wobble"):
+                fx.wobble(buf, game.play["high_timer"])
+            fx.present(buf, screen, game.quality.flag("high_smooth"))
+        else:
+            draw_play_world(game, queue, params, game.layout)
+
+        # HUD (via de queue na de wereld; alle teksten samen in één blits-call)
+        hud = queue
+        hud.layer = LAYER_HUD
+        draw_text(hud, game.font,
+                  f"Level {game.selected_level}  |  Punten: {int(game.play['score'])}  |  x{params['mult']:.2f}",
+                  int(game.WIDTH * 0.02), int(game.HEIGHT * 0.02), (0, 0, 0))
+
+        if game.mode == "highscore":
+            draw_text(hud, game.small, "HIGHSCORE MODE  |  Houd SPATIE = telefoon | Houd C = joint | ESC = menu",
+                      int(game.WIDTH * 0.02), int(game.HEIGHT * 0.07), (0, 0, 0))
+            draw_text(hud, game.small, f"Beste: {int(game.save.get('highscore', 0))}",
+                      int(game.WIDTH * 0.02), int(game.HEIGHT * 0.11), (0, 0, 0))
+        else:
+            draw_text(hud, game.small, "Houd SPATIE = telefoon | Houd C = joint | ESC = hoofdmenu",
+                      int(game.WIDTH * 0.02), int(game.HEIGHT * 0.07), (0, 0, 0))
+            draw_text(hud, game.small, f"Doel: {complete_score}",
+                      int(game.WIDTH * 0.02), int(game.HEIGHT * 0.11), (0, 0, 0))
+
+        if game.play["boss_state"] == WALKING_IN:
+            left = max(0.0, params["grace"] - game.play["reaction_timer"])
+            draw_text(hud, game.font, f"BAAS KOMT! Loslaten binnen {left:.2f}s!", int(game.WIDTH * 0.02), int(game.HEIGHT * 0.15), (204, 0, 0))
+        elif game.play["boss_state"] == LOOKING:
+            draw_text(hud, game.font, "BAAS KIJKT!", int(game.WIDTH * 0.02), int(game.HEIGHT * 0.15), (204, 0, 0))
+        elif game.play.get("smoking", False):
+            progress = min(game.play.get("smoking_timer", 0.0) / 5.0, 1.0)
+            draw_text(hud, game.font, f"Roken: {progress:.1%}", int(game.WIDTH * 0.02), int(game.HEIGHT * 0.15), (0, 150, 0))
+
+        # progress bar: alleen in level mode
+        if game.mode != "highscore":
+            pct = clamp(game.play["score"] / complete_score, 0.0, 1.0)
+            bar = pygame.Rect(int(game.WIDTH * 0.02) + game.play.get("shake_x", 0),
+                              int(game.HEIGHT * 0.20) + game.play.get("shake_y", 0),
+                              int(game.WIDTH * 0.27), int(game.HEIGHT * 0.03))
+            hud.draw(rect_fn((20, 20, 25), bar, border_radius=8))
+            hud.draw(rect_fn((90, 220, 120), (bar.x, bar.y, int(bar.w * pct), bar.h), border_radius=8))
+
+        queue.flush(screen)
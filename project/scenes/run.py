@@ -0,0 +1,85 @@
+# scenes/run.py
+# Een run starten: start_level() (normale levels) en start_highscore() (endless).
+
+# Zet de play-state terug en schakelt naar SCENE_PLAY; apart van scenes/play.py zodat de
+# menu's dit kunnen gebruiken zonder de play-scene al te importeren
+
+from constants import SCENE_PLAY, WAIT
+from levels import make_level_params, schedule_next_check
+
+
+def start_level(game, level_num: int):
+    game.mode = "level"  # ✅ belangrijk: terug naar level mode
+    game.selected_level = level_num
+    params = make_level_params(level_num - 1)
+
+    game.play["score"] = 0.0
+    game.play["phone"] = False
+    game.play["phone_hold_time"] = 0.0
+    game.play["gameover"] = False
+    game.play["caught"] = False
+    game.play["boss_state"] = WAIT
+    game.play["boss_timer"] = 0.0
+    game.play["reaction_timer"] = 0.0
+    game.play["boss_start"] = (0, 0)
+    game.play["boss_end"] = (0, 0)
+    game.play["boss_from_left"] = True
+    game.play["hands_anim_t"] = 0.0
+    game.play["hands_anim_frame"] = 0
+    game.play["pre_walk_sound_started"] = False
+
+    # extra mechanics
+    if "smoking" in game.play:
+        game.play["smoking"] = False
+        game.play["smoking_timer"] = 0.0
+        game.play["high_timer"] = 0.0
+        game.play["shake_x"] = 0
+        game.play["shake_y"] = 0
+        game.play["hallucination_color"] = (0, 255, 0)
+        game.play["hallucination_timer"] = 0.0
+
+    game.stop_all_loop_sounds()
+    schedule_next_check(game.play, params, game.audio_latency)
+
+    game.scene = SCENE_PLAY
+    game.loops.play("typing")
+
+
+# -----------------------------
+# Start highscore (endless)
+# -----------------------------
+def start_highscore(game):
+    game.mode = "highscore"
+    game.selected_level = 1
+
+    params = make_level_params(0)  # ✅ MUST exist
+
+    game.play["score"] = 0.0
+    game.play["phone"] = False
+    game.play["phone_hold_time"] = 0.0
+    game.play["gameover"] = False
+    game.play["caught"] = False
+    game.play["boss_state"] = WAIT
+    game.play["boss_timer"] = 0.0
+    game.play["reaction_timer"] = 0.0
+    game.play["boss_start"] = (0, 0)
+    game.play["boss_end"] = (0, 0)
+    game.play["boss_from_left"] = True
+    game.play["hands_anim_t"] = 0.0
+    game.play["hands_anim_frame"] = 0
+    game.play["pre_walk_sound_started"] = False
+
+    if "smoking" in game.play:
+        game.play["smoking"] = False
+        game.play["smoking_timer"] = 0.0
+        game.play["high_timer"] = 0.0
+        game.play["shake_x"] = 0
+        game.play["shake_y"] = 0
+        game.play["hallucination_timer"] = 0.0
+        game.play["hallucination_color"] = (0, 255, 0)
+
+    game.stop_all_loop_sounds()
+    schedule_next_check(game.play, params, game.audio_latency)
+
+    game.scene = SCENE_PLAY
+    game.loops.play("typing")
@@ -0,0 +1,230 @@
+# scenes/shop.py
+# Shop: tabs, filter, scrollbare grid met kaarten (via de render queue) en zijpaneel.
+
+# enter() selecteert het uitgeruste item van de huidige tab
+# exit() schrijft nieuwe thumbs weg (als achtergrondtaak) en geeft de thumbnail-cache en de
+# decode-workers vrij; ontbrekende thumbs (zichtbaar + de rij eronder) worden als taak geladen,
+# tot dan staat er een grijze placeholder
+
+import pygame
+
+from config import (
+    COL_PANEL_BG, COL_CARD_BG, COL_BORDER, COL_MUTED, COL_TEXT, POPUP_DURATION, SHOP_ITEMS,
+    SHOP_GRID_COLS, SHOP_FILTERS,
+)
+from constants import SCENE_SHOP
+from utils import draw_text, clamp
+from decode_pool import start_pool, shutdown_pool
+from shop import buy_or_equip, catalog_items
+from render_queue import LAYER_CARDS, LAYER_THUMBS, LAYER_HUD, rect_fn
+from tasks import call_steps
+from scenes.base import Scene
+
+SHOP_FILTER_LABELS = {"all": "ALLES", "owned": "OWNED", "unowned": "NIET OWNED"}
+
+
+class ShopScene(Scene):
+    name = SCENE_SHOP
+
+    def enter(self, game, previous):
+        start_pool(len(SHOP_ITEMS))
+        if game.shop_tab == "phone":
+            game.shop_selected_id = game.save["equipped"].get("phone", "phone_default")
+        else:
+            game.shop_selected_id = game.save["equipped"].get("laptop", "laptop_default")
+
+    def exit(self, game, next_scene):
+        game.tasks.cancel("shop_thumbs")
+        game.tasks.add("thumb_store", call_steps(game.shop_thumbs.flush))
+        game.shop_thumbs.clear()
+        shutdown_pool()
+
+    def draw(self, game, click):
+        screen = game.screen
+        mx, my = pygame.mouse.get_pos()
+
+        screen.fill(COL_PANEL_BG)
+
+        margin = int(game.WIDTH * 0.04)
+        top_y = int(game.HEIGHT * 0.04)
+
+        grid_x, grid_y = margin, int(game.HEIGHT * 0.22)
+        grid_w, grid_h = int(game.WIDTH * 0.64), int(game.HEIGHT * 0.70)
+        side_x = grid_x + grid_w + int(game.WIDTH * 0.02)
+        side_y = grid_y
+        side_w = game.WIDTH - side_x - margin
+
+        grid_rect = pygame.Rect(grid_x, grid_y, grid_w, grid_h)
+        side_rect = pygame.Rect(side_x, side_y, side_w, grid_h)
+
+        tab_h = int(game.HEIGHT * 0.08)
+        tab_w = int(game.WIDTH * 0.18)
+        tab_gap = int(game.WIDTH * 0.015)
+        tabs_y = grid_y - tab_h - int(game.HEIGHT * 0.02)
+
+        phone_tab_rect = pygame.Rect(grid_x, tabs_y, tab_w, tab_h)
+        laptop_tab_rect = pygame.Rect(grid_x + tab_w + tab_gap, tabs_y, tab_w, tab_h)
+
+        if game.tab_button(phone_tab_rect, "TELEFOONS", game.shop_tab == "phone") and click:
+            game.shop_tab = "phone"
+            game.shop_selected_id = game.save["equipped"].get("phone", "phone_default")
+            game.shop_scroll = 0
+
+        if game.tab_button(laptop_tab_rect, "LAPTOPS", game.shop_tab == "laptop") and click:
+            game.shop_tab = "laptop"
+            game.shop_selected_id = game.save["equipped"].get("laptop", "laptop_default")
+            game.shop_scroll = 0
+
+        filter_tab_rect = pygame.Rect(grid_x + grid_w - tab_w, tabs_y, tab_w, tab_h)
+        filter_label = SHOP_FILTER_LABELS.get(game.shop_filter, "ALLES")
+        if game.tab_button(filter_tab_rect, filter_label, game.shop_filter != "all") and click:
+            i = SHOP_FILTERS.index(game.shop_filter) if game.shop_filter in SHOP_FILTERS else 0
+            game.shop_filter = SHOP_FILTERS[(i + 1) % len(SHOP_FILTERS)]
+            game.shop_scroll = 0
+
+        title_surf = game.title_font.render("SHOP", True, COL_TEXT)
+        screen.blit(title_surf, (game.WIDTH // 2 - title_surf.get_width() // 2, top_y))
+
+        coins_surf = game.font.render(f"Coins: {game.save['coins']}", True, COL_TEXT)
+        screen.blit(coins_surf, (game.WIDTH - margin - coins_surf.get_width(), top_y + int(game.HEIGHT * 0.02)))
+
+        pygame.draw.rect(screen, COL_CARD_BG, grid_rect, border_radius=18)
+        pygame.draw.rect(screen, COL_BORDER, grid_rect, 3, border_radius=18)
+        pygame.draw.rect(screen, COL_CARD_BG, side_rect, border_radius=18)
+        pygame.draw.rect(screen, COL_BORDER, side_rect, 3, border_radius=18)
+
+        items = catalog_items(game.shop_catalog, game.shop_tab, game.save, game.shop_filter)
+
+        if (game.shop_selected_id is None) or (game.shop_selected_id not in SHOP_ITEMS) or (SHOP_ITEMS[game.shop_selected_id]["type"] != game.shop_tab):
+            game.shop_selected_id = game.save["equipped"].get(
+                "phone" if game.shop_tab == "phone" else "laptop",
+                "phone_default" if game.shop_tab == "phone" else "laptop_default"
+            )
+
+        cols = SHOP_GRID_COLS
+        pad = int(game.WIDTH * 0.012)
+        card_w = (grid_w - pad * (cols + 1)) // cols
+        card_h = int(game.HEIGHT * 0.20)
+        row_h = card_h + pad
+
+        # alleen de zichtbare rijen worden opgebouwd en getekend
+        rows = (len(items) + cols - 1) // cols
+        max_scroll = max(0, pad + rows * row_h - grid_h)
+        game.shop_scroll = int(clamp(game.shop_scroll, 0, max_scroll))
+        first_row = game.shop_scroll // row_h
+        last_row = min(rows, (game.shop_scroll + grid_h) // row_h + 1)
+
+        text_area_h = int(card_h * 0.36)
+        thumb_max_w = card_w - 20
+        thumb_max_h = card_h - text_area_h - 20
+
+        # ontbrekende thumbs (zichtbaar + de rij eronder) laden als taak; tot dan een placeholder
+        wanted = [i for i in items[first_row * cols:(last_row + 1) * cols] if i not in game.shop_thumbs]
+        if wanted and not (game.tasks.pending("shop_thumbs") and game.shop_thumbs.queued.issuperset(wanted)):
+            game.tasks.add("shop_thumbs", game.shop_thumbs.prefetch_steps(wanted))
+
+        # kaarten via de render queue: eerst alle vlakken, dan alle thumbs en alle teksten
+        # (elk in één blits-call)
+        queue = game.render_queue
+        screen.set_clip(grid_rect.inflate(-6, -6))
+        for rr in range(first_row, last_row):
+            for cc in range(cols):
+                idx = rr * cols + cc
+                if idx >= len(items):
+                    break
+                item_id = items[idx]
+                item = SHOP_ITEMS[item_id]
+
+                x = grid_x + pad + cc * (card_w + pad)
+                y = grid_y + pad + rr * row_h - game.shop_scroll
+                card = pygame.Rect(x, y, card_w, card_h)
+
+                owned = bool(game.save["owned"].get(item_id, False))
+                slot_key = "laptop" if item["type"] == "laptop" else "phone"
+                equipped = (game.save["equipped"].get(slot_key) == item_id)
+                selected = (game.shop_selected_id == item_id)
+
+                bgc = (255, 255, 255) if not selected else (255, 245, 210)
+                queue.draw(rect_fn(bgc, card, border_radius=16), LAYER_CARDS)
+                queue.draw(rect_fn(COL_BORDER if selected else COL_MUTED, card, 3, border_radius=16), LAYER_CARDS)
+
+                thumb_area = pygame.Rect(card.x, card.y, card.w, card.h - text_area_h)
+                text_area = pygame.Rect(card.x, card.y + thumb_area.h, card.w, text_area_h)
+
+                thumb = game.shop_thumbs.get_fitted(item_id, thumb_max_w, thumb_max_h, load=False)
+                if thumb:
+                    queue.blit(thumb, thumb.get_rect(center=thumb_area.center), layer=LAYER_THUMBS)
+                else:
+                    queue.draw(rect_fn((200, 200, 200), thumb_area.inflate(-20, -20), border_radius=10), LAYER_CARDS)
+
+                queue.draw(rect_fn((255, 255, 255), text_area, border_radius=14), LAYER_CARDS)
+                queue.draw(rect_fn(COL_MUTED, text_area, 2, border_radius=14), LAYER_CARDS)
+
+                name_s = game.small.render(item["name"], True, COL_TEXT)
+                queue.blit(name_s, (text_area.x + 10, text_area.y + 6), layer=LAYER_HUD)
+
+                if equipped:
+                    tag = "EQUIPPED"
+                elif owned:
+                    tag = "OWNED"
+                else:
+                    tag = f"{item['price']} coins"
+
+                tag_s = game.small.render(tag, True, COL_TEXT)
+                queue.blit(tag_s, (text_area.x + 10, text_area.y + 6 + name_s.get_height() + 2), layer=LAYER_HUD)
+
+                if click and card.collidepoint(mx, my) and grid_rect.collidepoint(mx, my):
+                    game.shop_selected_id = item_id
+        queue.flush(screen)
+        screen.set_clip(None)
+
+        # scrollbar
+        if max_scroll > 0:
+            track = pygame.Rect(grid_rect.right - 12, grid_y + 12, 6, grid_h - 24)
+            knob_h = max(24, track.h * grid_h // (grid_h + max_scroll))
+            knob_y = track.y + (track.h - knob_h) * game.shop_scroll // max_scroll
+            pygame.draw.rect(screen, COL_MUTED, track, border_radius=3)
+            pygame.draw.rect(screen, COL_BORDER, (track.x, knob_y, track.w, knob_h), border_radius=3)
+
+        if game.shop_selected_id in SHOP_ITEMS and SHOP_ITEMS[game.shop_selected_id]["type"] == game.shop_tab:
+            item = SHOP_ITEMS[game.shop_selected_id]
+            owned = bool(game.save["owned"].get(game.shop_selected_id, False))
+            slot_key = "laptop" if item["type"] == "laptop" else "phone"
+            equipped = (game.save["equipped"].get(slot_key) == game.shop_selected_id)
+
+            draw_text(screen, game.font, "Selected:", side_x + 18, side_y + 18, COL_TEXT)
+            draw_text(screen, game.font, item["name"], side_x + 18, side_y + 46, COL_TEXT)
+
+            prev_rect = pygame.Rect(side_x + 18, side_y + 80, side_w - 36, int(grid_h * 0.22))
+            preview = game.shop_thumbs.get_fitted(game.shop_selected_id, prev_rect.w - 16, prev_rect.h - 16, load=False)
+            if preview:
+                screen.blit(preview, preview.get_rect(center=prev_rect.center))
+
+            draw_text(screen, game.font, f"Price: {item['price']} coins", side_x + 18, side_y + int(grid_h * 0.36), COL_TEXT)
+            status = "Equipped" if equipped else ("Owned" if owned else "Not owned")
+            draw_text(screen, game.font, f"Status: {status}", side_x + 18, side_y + int(grid_h * 0.41), COL_TEXT)
+
+            btn = pygame.Rect(side_x + 18, side_y + int(grid_h * 0.52), side_w - 36, int(grid_h * 0.10))
+
+            if equipped:
+                game.ui_button(btn, "EQUIPPED", enabled=False)
+            else:
+                if owned:
+                    if game.ui_button(btn, "EQUIP") and click:
+                        buy_or_equip(game.shop_selected_id, game.save, game.snd, game.set_popup, game.layout, game.img,
+                                     game.tasks)
+                else:
+                    can_buy = game.save["coins"] >= int(item["price"])
+                    if game.ui_button(btn, "KOOP" if can_buy else "TE WEINIG COINS", enabled=can_buy) and click and can_buy:
+                        buy_or_equip(game.shop_selected_id, game.save, game.snd, game.set_popup, game.layout, game.img,
+                                     game.tasks)
+                    elif click and btn.collidepoint(mx, my) and not can_buy:
+                        game.set_popup("Niet genoeg coins!", POPUP_DURATION)
+
+        if game.popup_timer > 0 and game.popup_text:
+            w, h = int(game.WIDTH * 0.54), int(game.HEIGHT * 0.12)
+            rect = pygame.Rect((game.WIDTH - w) // 2, int(game.HEIGHT * 0.03), w, h)
+            pygame.draw.rect(screen, (255, 255, 255), rect, border_radius=16)
+            pygame.draw.rect(screen, COL_BORDER, rect, 3, border_radius=16)
+            t = game.font.render(game.popup_text, True, COL_TEXT)
+            screen.blit(t, (rect.centerx - t.get_width() // 2, rect.centery - t.get_height() // 2))
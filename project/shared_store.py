@@ -0,0 +1,166 @@
+# shared_store.py
+# Gedeelde opslag van geschaalde (gedecodeerde) assets voor meerdere game-instances.
+
+# Elke instance schaalt naar dezelfde schermgrootte, dus het resultaat wordt één keer
+# als ruwe BGRA pixels weggeschreven in SHARED_STORE_DIR (/dev/shm op Linux = RAM)
+
+# Andere instances mmap'en dat bestand en maken er zonder kopie een Surface van
+# (pygame.image.frombuffer), zodat het OS de pixels maar één keer in RAM houdt
+
+# attach() probeert een bestaand bestand te openen, publish() schrijft een nieuw weg
+# (getrimde sprites: OGS2-header met offset en volledige grootte, zie sprites.py)
+
+# /dev/shm is RAM en wordt pas bij een reboot leeg; sweep() (bij het maken van de store) ruimt
+# daarom bestanden op die SHARED_STORE_MAX_AGE_DAYS niet gebruikt zijn (attach() zet de mtime)
+# en daarna de oudste zolang de map groter is dan SHARED_STORE_MAX_MB; ook andere resoluties
+# en achtergebleven .tmp-bestanden. Wat in de laatste SHARED_STORE_KEEP_HOURS gebruikt is blijft
+# altijd staan (draaiende instances), ook als dat alleen al boven het maximum zit (dan een melding)
+import mmap
+import os
+import struct
+import time
+import pygame
+from config import SHARED_STORE_DIR, SHARED_STORE_MAX_AGE_DAYS, SHARED_STORE_MAX_MB, SHARED_STORE_KEEP_HOURS
+from sprites import TrimmedSurface, trimmed_from
+
+STORE_MAGIC = b"OGS1"
+HEADER = struct.Struct(">4sII")   # magic, w, h
+TRIM_MAGIC = b"OGS2"
+TRIM_HEADER = struct.Struct(">4sIIIIII")   # magic, w, h, offset x/y, volledige w/h
+
+class SharedAssetStore:
+    def __init__(self, directory=SHARED_STORE_DIR, max_age_days=SHARED_STORE_MAX_AGE_DAYS,
+                 max_mb=SHARED_STORE_MAX_MB, keep_hours=SHARED_STORE_KEEP_HOURS):
+        self.dir = directory
+        self.stats = {"attached": 0, "published": 0, "swept": 0}
+        self.sweep(max_age_days, max_mb, keep_hours)
+
+    def sweep(self, max_age_days=SHARED_STORE_MAX_AGE_DAYS, max_mb=SHARED_STORE_MAX_MB,
+              keep_hours=SHARED_STORE_KEEP_HOURS):
+        try:
+            names = os.listdir(self.dir)
+        except OSError:
+            return
+        now = time.time()
+        entries = []   # (mtime, grootte, pad, is .tmp)
+        for name in names:
+            if not (name.endswith(".bgra") or name.endswith(".tmp")):
+                continue
+            path = os.path.join(self.dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path, name.endswith(".tmp")))
+        entries.sort()
+
+        max_age = max_age_days * 86400 if max_age_days > 0 else float("inf")
+        keep = keep_hours * 3600
+        total = sum(size for _, size, _, _ in entries)
+        budget = max_mb * 1024 * 1024 if max_mb > 0 else None
+        for mtime, size, path, tmp in entries:
+            # .tmp van een publish() die nooit afkwam (na een uur); verder oudste eerst, maar
+            # nooit wat recent gebruikt is (andere instances hebben dat nog gemapt)
+            age = now - mtime
+            if tmp:
+                remove = age > 3600
+            else:
+                remove = age > max_age or (budget is not None and total > budget and age > keep)
+            if not remove:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.stats["swept"] += 1
+        if budget is not None and total > budget:
+            # de recent gebruikte set is zelf al groter (bv. 4K); niet weggooien, wel melden
+            print(f"shared store: {total / 1048576:.0f} MB in gebruik, meer dan SHARED_STORE_MAX_MB ({max_mb})")
+
+    def entry_name(self, key, file_sha, w, h):
+        safe_key = "".join(c if c.isalnum() or c in "-_" else "_" for c in key)
+        return f"{safe_key}-{file_sha[:16]}-{int(w)}x{int(h)}.bgra"
+
+    def has(self, name):
+        return os.path.exists(os.path.join(self.dir, name))
+
+    def attach(self, name, size):
+        path = os.path.join(self.dir, name)
+        w, h = size
+        try:
+            with open(path, "rb") as f:
+                # ACCESS_COPY: pagina's blijven gedeeld zolang niemand erin schrijft
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(path)   # laatst gebruikt, voor sweep()
+        except OSError:
+            pass
+        if mm[:4] == TRIM_MAGIC:
+            return self._attach_trimmed(mm, size)
+        if len(mm) != HEADER.size + w * h * 4 or HEADER.unpack_from(mm) != (STORE_MAGIC, w, h):
+            mm.close()
+            return None
+        # de Surface houdt de memoryview (en dus de mmap) zelf in leven
+        surf = pygame.image.frombuffer(memoryview(mm)[HEADER.size:], (w, h), "BGRA")
+        self.stats["attached"] += 1
+        return surf
+
+    def _attach_trimmed(self, mm, size):
+        # getrimde sprites zijn klein; die worden gekopieerd naar een TrimmedSurface
+        # (een Surface-subclass kan niet direct op de mmap staan)
+        try:
+            _, w, h, ox, oy, fw, fh = TRIM_HEADER.unpack_from(mm)
+            if (fw, fh) != tuple(size) or len(mm) != TRIM_HEADER.size + w * h * 4:
+                mm.close()
+                return None
+            pixels = pygame.image.frombuffer(memoryview(mm)[TRIM_HEADER.size:], (w, h), "BGRA")
+            surf = trimmed_from(pixels, (ox, oy), (fw, fh))
+        except (struct.error, ValueError, pygame.error):
+            return None
+        # de mmap wordt vrijgegeven zodra pixels opgeruimd is
+        self.stats["attached"] += 1
+        return surf
+
+    def publish(self, name, surf):
+        w, h = surf.get_size()
+        path = os.path.join(self.dir, name)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.dir, exist_ok=True)
+            with open(tmp, "wb") as f:
+                if isinstance(surf, TrimmedSurface):
+                    f.write(TRIM_HEADER.pack(TRIM_MAGIC, w, h, *surf.offset, *surf.full_size))
+                else:
+                    f.write(HEADER.pack(STORE_MAGIC, w, h))
+                f.write(pygame.image.tobytes(surf, "BGRA"))
+            os.replace(tmp, path)
+        except OSError:
+            return surf
+        self.stats["published"] += 1
+        self._remove_stale(name)
+
+        # zelf ook de gedeelde kopie gebruiken, dan staat de pixeldata maar één keer in RAM
+        if isinstance(surf, TrimmedSurface):
+            return surf
+        return self.attach(name, (w, h)) or surf
+
+    def _remove_stale(self, name):
+        # oude versies van hetzelfde asset (andere hash) opruimen; instances die ze
+        # nog gemapt hebben houden hun kopie tot ze stoppen
+        key, sha, _ = name.rsplit("-", 2)
+        try:
+            entries = os.listdir(self.dir)
+        except OSError:
+            return
+        for other in entries:
+            if not other.endswith(".bgra") or other.count("-") < 2:
+                continue
+            other_key, other_sha, _ = other.rsplit("-", 2)
+            if other_key == key and other_sha != sha:
+                try:
+                    os.remove(os.path.join(self.dir, other))
+                except OSError:
+                    pass
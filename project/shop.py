@@ -1,48 +1,255 @@
 # shop.py
 # Shop-logica die losstaat van rendering.
 
-# build_shop_thumbs() maakt thumbnails uit item-images
+# build_catalog_index() / catalog_items() geven de items per tab (gesorteerd op prijs)
+
+# ThumbCache laadt thumbnails pas als ze zichtbaar worden (LRU, max SHOP_THUMB_CACHE_SIZE)
+# en haalt ze uit de ThumbStore op schijf; alleen bij een miss wordt de volle PNG gedecodeerd,
+# en dat gebeurt in prefetch_steps() (een taak, tasks.py), nooit in draw: get(load=False)
+# geeft dan None en de shop tekent een placeholder
+
+# build_shop_thumbs() maakt de ThumbCache voor de shop
 
 # reload_laptop_asset() / reload_phone_asset() laadt de equipped skins
+# (reload_equipped_assets() doet beide in één batch bij het opstarten); een nieuwe skin
+# maakt de samengestelde play-lagen en de play-atlas ongeldig
 
-# buy_or_equip() verwerkt kopen/equippen + coins + save + popup + sound
+# buy_or_equip() verwerkt kopen/equippen + coins + save + popup + sound; met een TaskScheduler
+# worden opslaan en de nieuwe skin (reload_asset_steps()) achtergrondtaken
+import os
+from collections import OrderedDict
 import pygame
-from config import SHOP_ITEMS, POPUP_DURATION
-from save_system import write_save
-from utils import load_image, scale
+from config import ASSETS_DIR, SHOP_ITEMS, POPUP_DURATION, SHOP_THUMB_CACHE_SIZE
+from decode_pool import future_surface, submit_file
+from play_layers import invalidate_play_layers
+from save_system import write_save, write_save_steps
+from thumb_store import ThumbStore
+from utils import load_image, fit_image, file_hash
 
-def build_shop_thumbs(THUMB_W, THUMB_H):
-    thumbs = {}
-    for item_id, item in SHOP_ITEMS.items():
+def build_catalog_index(items=SHOP_ITEMS):
+    # eenmalig: per type ("laptop"/"phone") de item ids, goedkoopste eerst
+    index = {}
+    for item_id, item in items.items():
+        index.setdefault(item["type"], []).append(item_id)
+    for ids in index.values():
+        ids.sort(key=lambda iid: int(items[iid]["price"]))
+    return index
+
+def catalog_items(index, tab, save, owned_filter="all"):
+    ids = index.get(tab, [])
+    if owned_filter == "owned":
+        return [iid for iid in ids if save["owned"].get(iid, False)]
+    if owned_filter == "unowned":
+        return [iid for iid in ids if not save["owned"].get(iid, False)]
+    return ids
+
+def _thumb_hash(item_id):
+    try:
+        return file_hash(os.path.join(ASSETS_DIR, SHOP_ITEMS[item_id]["file"]))
+    except OSError:
+        return None
+
+def _placeholder_thumb(thumb_w, thumb_h):
+    surf = pygame.Surface((thumb_w, thumb_h), pygame.SRCALPHA)
+    surf.fill((200, 200, 200))
+    return surf
+
+def _make_thumb(item_id, thumb_w, thumb_h, store=None, img=None):
+    key = _thumb_hash(item_id)
+    if store is not None and key is not None:
+        thumb = store.get(key)
+        if thumb is not None:
+            return thumb
+
+    try:
+        if img is None:
+            img = load_image(SHOP_ITEMS[item_id]["file"], (thumb_w, thumb_h))
+        thumb = pygame.transform.smoothscale(img, (thumb_w, thumb_h))
+    except Exception:
+        return _placeholder_thumb(thumb_w, thumb_h)
+
+    if store is not None and key is not None:
+        store.put(key, thumb)
+    return thumb
+
+class ThumbCache:
+    # Thumbnails worden pas geladen als een kaart zichtbaar is.
+    # Zowel de thumbs als de passend geschaalde versies (per kaartgrootte)
+    # zitten in één LRU, zodat het geheugen niet meegroeit met de catalogus.
+    def __init__(self, thumb_w, thumb_h, capacity=SHOP_THUMB_CACHE_SIZE, store=None):
+        self.thumb_w = thumb_w
+        self.thumb_h = thumb_h
+        self.capacity = max(1, int(capacity))
+        self.store = store
+        self._cache = OrderedDict()
+        self.queued = set()   # item ids van de laatste prefetch_steps()-taak
+
+    def __len__(self):
+        return len(self._cache)
+
+    def _lookup(self, key):
+        surf = self._cache.get(key)
+        if surf is not None:
+            self._cache.move_to_end(key)
+        return surf
+
+    def _store(self, key, surf):
+        self._cache[key] = surf
+        while len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+        return surf
+
+    def get(self, item_id, default=None, load=True):
+        # load=False: alleen wat al klaar is (cache of ThumbStore), zonder PNG te decoderen
+        if item_id not in SHOP_ITEMS:
+            return default
+        surf = self._lookup(item_id)
+        if surf is None:
+            key = _thumb_hash(item_id)
+            if self.store is not None and key is not None:
+                surf = self.store.get(key)
+            if surf is None and not load:
+                return default
+            if surf is None:
+                surf = _make_thumb(item_id, self.thumb_w, self.thumb_h, self.store)
+            self._store(item_id, surf)
+        return surf
+
+    def get_fitted(self, item_id, max_w, max_h, load=True):
+        key = (item_id, int(max_w), int(max_h))
+        surf = self._lookup(key)
+        if surf is None:
+            thumb = self.get(item_id, load=load)
+            if thumb is None:
+                return None
+            surf = fit_image(thumb, max_w, max_h)
+            if surf is not None:
+                self._store(key, surf)
+        return surf
+
+    def prefetch_steps(self, item_ids):
+        # als taak (tasks.py): één thumb per stap; met een draaiende decode-pool worden alle
+        # PNG's tegelijk ingediend en de Futures per frame gepold, anders per stap gedecodeerd
+        self.queued = set(item_ids)
+        missing = {}
+        for item_id in item_ids:
+            if item_id in SHOP_ITEMS and item_id not in self._cache:
+                if self.get(item_id, load=False) is None:
+                    missing[item_id] = SHOP_ITEMS[item_id]["file"]
+                yield
+        target = (self.thumb_w, self.thumb_h)
+        futures = {}
+        if len(missing) >= 2:
+            for item_id, filename in missing.items():
+                future = submit_file(filename, target)
+                if future is None:
+                    break
+                futures[item_id] = future
         try:
-            img = load_image(item["file"])
-            thumbs[item_id] = pygame.transform.smoothscale(img, (THUMB_W, THUMB_H))
-        except Exception:
-            surf = pygame.Surface((THUMB_W, THUMB_H), pygame.SRCALPHA)
-            surf.fill((200, 200, 200))
-            thumbs[item_id] = surf
-    return thumbs
+            for item_id in missing:
+                future = futures.get(item_id)
+                img = None
+                if future is not None:
+                    while not future.done():
+                        yield
+                    img = future_surface(future)
+                self._store(item_id, _make_thumb(item_id, self.thumb_w, self.thumb_h, self.store, img))
+                yield
+        finally:
+            # vervangen/geannuleerd (scrollen, shop verlaten): wat nog wacht niet meer decoderen
+            for future in futures.values():
+                future.cancel()
+
+    def __contains__(self, item_id):
+        return item_id in self._cache
+
+    def values(self):
+        return self._cache.values()
+
+    def clear(self):
+        self._cache.clear()
+
+    def flush(self):
+        if self.store is not None:
+            self.store.flush()
+
+def build_shop_thumbs(THUMB_W, THUMB_H):
+    return ThumbCache(THUMB_W, THUMB_H, store=ThumbStore(THUMB_W, THUMB_H))
+
+def _equipped_key(save, slot):
+    key = save["equipped"].get(slot, f"{slot}_default")
+    if key not in SHOP_ITEMS or SHOP_ITEMS[key]["type"] != slot:
+        key = f"{slot}_default"
+    return key
+
+def _skin_key(img, item_id):
+    # skins worden pas bij equip in de registry gezet (en dus gedecodeerd)
+    key = f"skin:{item_id}"
+    if key not in img:
+        img.register(key, SHOP_ITEMS[item_id]["file"], trim=True)
+    return key
 
 def reload_laptop_asset(save, layout, img):
-    key = save["equipped"].get("laptop", "laptop_default")
-    if key not in SHOP_ITEMS or SHOP_ITEMS[key]["type"] != "laptop":
-        key = "laptop_default"
-    img_laptop = load_image(SHOP_ITEMS[key]["file"])
-    layout["laptop_nohands_s"] = scale(img_laptop, *layout["LAPTOP_SIZE"])
-    return img_laptop
+    key = _equipped_key(save, "laptop")
+    laptop_s = img.scaled(_skin_key(img, key), *layout["LAPTOP_SIZE"])
+    img.release_sources()
+    layout["laptop_nohands_s"] = laptop_s
+    invalidate_play_layers(layout)
+    return laptop_s
 
 def reload_phone_asset(save, layout, img):
-    key = save["equipped"].get("phone", "phone_default")
-    if key not in SHOP_ITEMS or SHOP_ITEMS[key]["type"] != "phone":
-        key = "phone_default"
+    key = _equipped_key(save, "phone")
     try:
-        img_phone = load_image(SHOP_ITEMS[key]["file"])
+        phone_s = img.scaled(_skin_key(img, key), *layout["PHONE_SIZE"])
     except Exception:
-        img_phone = img["phone_default"]
-    layout["phone_skin_s"] = scale(img_phone, *layout["PHONE_SIZE"])
-    return img_phone
+        phone_s = None
+    if phone_s is None:
+        phone_s = img.scaled("phone_default", *layout["PHONE_SIZE"])
+    img.release_sources()
+    layout["phone_skin_s"] = phone_s
+    invalidate_play_layers(layout)
+    return phone_s
 
-def buy_or_equip(item_id, save, snd, set_popup, layout, img):
+def reload_asset_steps(save, layout, img, slot):
+    # als taak: decoderen, schalen enz. in aparte stappen (img.scaled_steps), dan in de layout
+    key = _skin_key(img, _equipped_key(save, slot))
+    try:
+        surf = yield from img.scaled_steps(key, *layout["LAPTOP_SIZE" if slot == "laptop" else "PHONE_SIZE"])
+    except Exception:
+        surf = None
+    if surf is None:
+        # mislukt: de gewone weg (de telefoon valt dan terug op phone_default)
+        if slot == "laptop":
+            reload_laptop_asset(save, layout, img)
+        else:
+            reload_phone_asset(save, layout, img)
+        return
+    img.release_sources()
+    layout["laptop_nohands_s" if slot == "laptop" else "phone_skin_s"] = surf
+    invalidate_play_layers(layout)
+
+def reload_equipped_assets(save, layout, img):
+    try:
+        scaled = img.scaled_many({
+            "laptop_nohands_s": (_skin_key(img, _equipped_key(save, "laptop")),) + tuple(layout["LAPTOP_SIZE"]),
+            "phone_skin_s": (_skin_key(img, _equipped_key(save, "phone")),) + tuple(layout["PHONE_SIZE"]),
+        })
+    except Exception:
+        scaled = {}
+    if scaled.get("laptop_nohands_s") is None:
+        reload_laptop_asset(save, layout, img)
+    else:
+        layout["laptop_nohands_s"] = scaled["laptop_nohands_s"]
+        invalidate_play_layers(layout)
+    if scaled.get("phone_skin_s") is None:
+        reload_phone_asset(save, layout, img)
+    else:
+        layout["phone_skin_s"] = scaled["phone_skin_s"]
+        invalidate_play_layers(layout)
+    img.release_sources()
+
+def buy_or_equip(item_id, save, snd, set_popup, layout, img, tasks=None):
+    # tasks (TaskScheduler): opslaan en de skin laden gebeuren dan in de achtergrond
     if item_id not in SHOP_ITEMS:
         return
 
@@ -72,6 +279,10 @@ def buy_or_equip(item_id, save, snd, set_popup, layout, img):
         set_popup(f"Equipped: {item['name']}!", POPUP_DURATION)
 
     save["equipped"][slot_key] = item_id
+    if tasks is not None:
+        tasks.add("save", write_save_steps(save))
+        tasks.add(f"skin:{slot_key}", reload_asset_steps(save, layout, img, slot_key))
+        return
     write_save(save)
 
     if item_type == "laptop":
@@ -0,0 +1,62 @@
+# sprites.py
+# Sprites zonder hun transparante randen.
+
+# Veel sprites (handen, laptops, telefoons) zijn schermvullende PNG's die grotendeels doorzichtig
+# zijn; trim_surface() knipt na het schalen alles weg buiten de zichtbare bounding box
+
+# TrimmedSurface is gewoon een Surface (alleen het zichtbare deel) die onthoudt waar dat deel
+# in de volledige sprite stond (offset) en hoe groot de volledige sprite was (full_size)
+
+# blit_sprite() / sprite_rect() tellen die offset erbij, zodat de layout-code gewoon met de
+# volledige posities en groottes blijft rekenen
+import pygame
+from config import TRIM_MIN_ALPHA, TRIM_MAX_KEEP
+
+class TrimmedSurface(pygame.Surface):
+    def __init__(self, size, offset, full_size, like):
+        # like: Surface waarvan het pixelformaat overgenomen wordt (display-formaat blit het snelst)
+        super().__init__(size, pygame.SRCALPHA, like)
+        self.offset = (int(offset[0]), int(offset[1]))
+        self.full_size = (int(full_size[0]), int(full_size[1]))
+
+def trimmed_from(pixels, offset, full_size, area=None):
+    # kopieert (een stuk van) pixels in een nieuwe TrimmedSurface
+    area = area if area is not None else pixels.get_rect()
+    surf = TrimmedSurface(area.size, offset, full_size, pixels)
+    # MAX op een lege (0,0,0,0) surface = exacte kopie, ook van de alpha
+    surf.blit(pixels, (0, 0), area, special_flags=pygame.BLEND_RGBA_MAX)
+    return surf
+
+def trim_surface(surf, min_alpha=TRIM_MIN_ALPHA, max_keep=TRIM_MAX_KEEP):
+    # pixels met alpha < min_alpha tellen als leeg; alleen trimmen als het echt iets scheelt
+    if isinstance(surf, TrimmedSurface) or not surf.get_flags() & pygame.SRCALPHA:
+        return surf
+    w, h = surf.get_size()
+    rect = surf.get_bounding_rect(min_alpha)
+    if rect.w == 0 or rect.h == 0:
+        rect = pygame.Rect(0, 0, 1, 1)
+    if rect.w * rect.h > w * h * max_keep:
+        return surf
+    return trimmed_from(surf, rect.topleft, (w, h), rect)
+
+def scale_trimmed(surf, w, h, scaler):
+    # schaalt een TrimmedSurface alsof het de volledige sprite van w x h is
+    fw, fh = surf.full_size
+    fx, fy = w / fw, h / fh
+    ox, oy = surf.offset
+    x0, y0 = int(round(ox * fx)), int(round(oy * fy))
+    x1 = int(round((ox + surf.get_width()) * fx))
+    y1 = int(round((oy + surf.get_height()) * fy))
+    pixels = scaler(surf, (max(1, x1 - x0), max(1, y1 - y0)))
+    return trimmed_from(pixels, (x0, y0), (w, h))
+
+def sprite_offset(surf):
+    return getattr(surf, "offset", (0, 0))
+
+def sprite_rect(surf, pos):
+    ox, oy = sprite_offset(surf)
+    return surf.get_rect(topleft=(pos[0] + ox, pos[1] + oy))
+
+def blit_sprite(target, surf, pos, area=None):
+    ox, oy = sprite_offset(surf)
+    return target.blit(surf, (pos[0] + ox, pos[1] + oy), area)
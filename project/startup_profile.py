@@ -0,0 +1,147 @@
+# startup_profile.py
+# Meetmodus voor de opstarttijd (STARTUP_PROFILE = True in config).
+
+# STARTUP wordt gemaakt bij de eerste import (als eerste in main.py); phase("naam") meet een stuk van
+# Game.__init__ (fonts, images, sounds, layout, thumbs, ...) als tijdlijn t.o.v. de start
+
+# install_import_timer() hangt een finder vooraan sys.meta_path die de loader van elke
+# module tijdelijk inpakt: per module de totale import-tijd en de eigen tijd (zonder de
+# imports die hij zelf weer doet)
+
+# first_frame() na de eerste flip: legt time-to-first-frame vast; write_report() schrijft
+# dat + tijdlijn + traagste imports naar STARTUP_PROFILE_PATH (met de vorige metingen erbij,
+# zodat je het verloop ziet), vanuit main.py als achtergrondtaak
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from config import STARTUP_PROFILE, STARTUP_PROFILE_PATH, STARTUP_PROFILE_HISTORY
+
+class _TimedLoader:
+    def __init__(self, loader, profile):
+        self.loader = loader
+        self.profile = profile
+
+    def create_module(self, spec):
+        # extensie-modules (.so) doen hun werk al in create_module
+        self.profile._import_begin(spec.name)
+        try:
+            return self.loader.create_module(spec)
+        finally:
+            self.profile._import_end(spec.name)
+
+    def exec_module(self, module):
+        name = module.__name__
+        self.profile._import_begin(name)
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.profile._import_end(name)
+            # de module ziet daarna alleen de echte loader
+            module.__loader__ = self.loader
+            if getattr(module, "__spec__", None) is not None:
+                module.__spec__.loader = self.loader
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+class _ImportTimer:
+    def __init__(self, profile):
+        self.profile = profile
+
+    def find_spec(self, name, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self.profile)
+                return spec
+        return None
+
+class StartupProfile:
+    def __init__(self, enabled=STARTUP_PROFILE):
+        self.enabled = enabled
+        self.t0 = time.perf_counter()
+        self.phases = []     # (naam, start, duur) in seconden t.o.v. t0
+        self.imports = {}    # module -> [totaal, eigen] in seconden
+        self._stack = []     # [module, start, tijd in sub-imports]
+        self._finder = None
+        self.first_frame_s = None
+
+    def install_import_timer(self):
+        if self.enabled and self._finder is None:
+            self._finder = _ImportTimer(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def remove_import_timer(self):
+        if self._finder is not None:
+            try:
+                sys.meta_path.remove(self._finder)
+            except ValueError:
+                pass
+            self._finder = None
+
+    def _import_begin(self, name):
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _import_end(self, name):
+        name, start, children = self._stack.pop()
+        total = time.perf_counter() - start
+        entry = self.imports.setdefault(name, [0.0, 0.0])
+        entry[0] += total
+        entry[1] += total - children
+        if self._stack:
+            self._stack[-1][2] += total
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, start - self.t0, time.perf_counter() - start))
+
+    def mark(self, name):
+        # moment zonder duur (bv. "imports klaar")
+        self.phases.append((name, time.perf_counter() - self.t0, 0.0))
+
+    def first_frame(self):
+        # True bij de eerste aanroep
+        if self.first_frame_s is not None:
+            return False
+        self.first_frame_s = time.perf_counter() - self.t0
+        self.remove_import_timer()
+        return True
+
+    def summary(self, top=25):
+        slowest = sorted(self.imports.items(), key=lambda kv: kv[1][1], reverse=True)[:top]
+        return {
+            "first_frame_ms": round(self.first_frame_s * 1000, 1) if self.first_frame_s else None,
+            "phases": [{"name": n, "start_ms": round(s * 1000, 1), "ms": round(d * 1000, 1)}
+                       for n, s, d in self.phases],
+            "imports_total_ms": round(sum(e[1] for e in self.imports.values()) * 1000, 1),
+            "slowest_imports": [{"module": m, "ms": round(t * 1000, 1), "self_ms": round(s * 1000, 1)}
+                                for m, (t, s) in slowest],
+        }
+
+    def write_report(self, path=STARTUP_PROFILE_PATH, history=STARTUP_PROFILE_HISTORY):
+        if not self.enabled:
+            return
+        report = self.summary()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                previous = json.load(f).get("history", [])
+        except Exception:
+            previous = []
+        report["history"] = (previous + [report["first_frame_ms"]])[-history:]
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+        except Exception:
+            pass
+
+STARTUP = StartupProfile()
@@ -25,6 +25,7 @@ def make_initial_play_state():
         "hands_anim_t": 0.0,
         "hands_anim_frame": 0,
         "pre_walk_sound_started": False,
+        "pre_walk_sound_at": 3.0,
 
         "smoking": False,
         "smoking_timer": 0.0,
@@ -0,0 +1,299 @@
+# surface_registry.py
+# Houdt alle gedecodeerde bron-images bij, met hun grootte in bytes.
+
+# SurfaceRegistry gedraagt zich als de oude img-dict (img["desk"], img.get(...), flags)
+# maar decodeert een bron pas bij gebruik en kan hem daarna weer vrijgeven
+
+# release_sources() na het schalen (recalc_layout), daarna wordt opnieuw gedecodeerd als het nodig is
+
+# Budget (IMAGE_RAM_BUDGET_MB) met LRU-eviction; report() geeft een overzicht per groep
+
+# scaled() geeft een geschaalde versie (getrimd bij register(trim=True), in het snelste
+# blit-formaat via finalize_scaled), via de SharedAssetStore als die aan staat
+# (dan hoeft de bron bij een warme start helemaal niet gedecodeerd te worden)
+
+# scaled_many() / preload() decoderen alle ontbrekende bronnen in één keer via decode_pool,
+# met de doelgrootte erbij zodat een kleinere build-variant (asset_build.py) gekozen kan worden
+
+# scaled_steps() is scaled() als generator voor taken (tasks.py): decoderen (via decode_pool als
+# die draait, dan wordt de Future gepold), converteren, schalen, trimmen en publiceren zijn elk
+# een aparte stap; het resultaat is de return-waarde (surf = yield from img.scaled_steps(...))
+import os
+import struct
+from collections import OrderedDict
+import pygame
+from config import ASSETS_DIR, IMAGE_RAM_BUDGET_MB, SHARED_ASSET_STORE
+from decode_pool import decode_files, future_surface, submit_file
+from shared_store import SharedAssetStore
+from sprites import trim_surface
+from utils import load_image, load_image_raw, convert_source, scale, file_hash, finalize_scaled
+
+def surface_bytes(surf) -> int:
+    if not isinstance(surf, pygame.Surface):
+        return 0
+    return surf.get_pitch() * surf.get_height()
+
+class SurfaceRegistry:
+    def __init__(self, budget_mb=IMAGE_RAM_BUDGET_MB, store=None):
+        self.budget = int(budget_mb * 1024 * 1024)
+        self.store = store if store is not None else (SharedAssetStore() if SHARED_ASSET_STORE else None)
+        self._loaders = {}            # key -> functie die de Surface decodeert
+        self._files = {}              # key -> bestandsnaam in ASSETS_DIR
+        self._paths = {}              # key -> pad van het bronbestand
+        self._trim = set()            # keys waarvan geschaalde versies getrimd worden
+        self._sources = OrderedDict() # key -> Surface (LRU: laatst gebruikt achteraan)
+        self._values = {}             # flags en andere vaste waarden
+        self._tracked = {}            # groep -> dict met surfaces (alleen voor de telling)
+        self.stats = {"decodes": 0, "evictions": 0, "releases": 0}
+
+    # --- registratie ---
+    def register(self, key, filename, optional=False, trim=False):
+        # Geeft terug of het bestand bestaat; ontbrekende verplichte assets crashen meteen
+        # trim=True: geschaalde versies verliezen hun transparante randen (sprites.py)
+        path = os.path.join(ASSETS_DIR, filename)
+        if not os.path.exists(path):
+            if not optional:
+                raise FileNotFoundError(f"Asset ontbreekt: {path}")
+            self._values[key] = None
+            return False
+        self._loaders[key] = lambda: load_image(filename)
+        self._files[key] = filename
+        self._paths[key] = path
+        if trim:
+            self._trim.add(key)
+        return True
+
+    def register_loader(self, key, loader):
+        self._loaders[key] = loader
+
+    def track(self, group, surfaces):
+        # surfaces: iets met .values() (bv. game.layout); wordt live meegeteld
+        self._tracked[group] = surfaces
+
+    # --- dict-interface ---
+    def __contains__(self, key):
+        return key in self._values or key in self._loaders
+
+    def __setitem__(self, key, value):
+        self._values[key] = value
+
+    def __getitem__(self, key):
+        if key in self._values:
+            return self._values[key]
+        surf = self._sources.get(key)
+        if surf is not None:
+            self._sources.move_to_end(key)
+            return surf
+        if key not in self._loaders:
+            raise KeyError(key)
+        return self._decode(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    # --- decode / vrijgeven ---
+    def _decode(self, key, target=None):
+        # target (w, h): er wordt daarna naar geschaald, dus een kleinere build-variant is genoeg
+        try:
+            if key in self._files:
+                surf = load_image(self._files[key], target)
+            else:
+                surf = self._loaders[key]()
+        except Exception:
+            surf = None
+        return self._keep_source(key, surf)
+
+    def _keep_source(self, key, surf):
+        self.stats["decodes"] += 1
+        if surf is None:
+            return None
+        self._sources[key] = surf
+        self.enforce_budget(keep=key)
+        return surf
+
+    def preload(self, keys, targets=None):
+        targets = targets or {}
+        files = {k: self._files[k] for k in keys
+                 if k in self._files and not self._covers(k, targets.get(k))}
+        if not files:
+            return
+        decoded = decode_files(files, targets)
+        self.stats["decodes"] += len(decoded)
+        for key, surf in decoded.items():
+            self._sources[key] = surf
+        self.enforce_budget()
+
+    def is_loaded(self, key):
+        return key in self._sources
+
+    def _covers(self, key, target):
+        # is de gedecodeerde bron (misschien een kleinere variant) groot genoeg voor target?
+        surf = self._sources.get(key)
+        if surf is None:
+            return False
+        if target is None or (surf.get_width() >= target[0] and surf.get_height() >= target[1]):
+            return True
+        # kleiner dan target, maar als het de volle resolutie is wordt het niet beter
+        return surf.get_size() == tuple(self.source_size(key))
+
+    def _source_for(self, key, w, h):
+        if self._covers(key, (w, h)):
+            self._sources.move_to_end(key)
+            return self._sources[key]
+        if key not in self._files:
+            return self[key]
+        return self._decode(key, (w, h))
+
+    def drop(self, key):
+        if self._sources.pop(key, None) is not None:
+            self.stats["releases"] += 1
+
+    def release_sources(self, keep=()):
+        for key in list(self._sources):
+            if key not in keep:
+                self.drop(key)
+
+    def enforce_budget(self, keep=None):
+        while self.total_bytes() > self.budget:
+            victim = next((k for k in self._sources if k != keep), None)
+            if victim is None:
+                break
+            del self._sources[victim]
+            self.stats["evictions"] += 1
+
+    # --- grootte / schalen ---
+    def source_size(self, key):
+        # Leest de PNG-header zodat de layout kan rekenen zonder te decoderen
+        # (een gedecodeerde bron kan een kleinere variant zijn, dus de header gaat voor)
+        path = self._paths.get(key)
+        if path is not None:
+            try:
+                with open(path, "rb") as f:
+                    head = f.read(24)
+                if head[:8] == b"\x89PNG\r\n\x1a\n" and head[12:16] == b"IHDR":
+                    return struct.unpack(">II", head[16:24])
+            except OSError:
+                pass
+        surf = self._sources.get(key) or self[key]
+        return surf.get_size() if surf is not None else (0, 0)
+
+    def _store_name(self, key, w, h):
+        if self.store is None or key not in self._paths:
+            return None
+        try:
+            store_key = key + "_trim" if key in self._trim else key
+            return self.store.entry_name(store_key, file_hash(self._paths[key]), w, h)
+        except OSError:
+            return None
+
+    def _scale_and_publish(self, key, w, h, name):
+        src = self._source_for(key, w, h)
+        if src is None:
+            return None
+        surf = scale(src, w, h)
+        if key in self._trim:
+            surf = trim_surface(surf)
+        if name is not None:
+            surf = self.store.publish(name, surf)
+        return surf
+
+    def scaled(self, key, w, h):
+        w, h = max(1, int(w)), max(1, int(h))
+        name = self._store_name(key, w, h)
+        if name is not None:
+            surf = self.store.attach(name, (w, h))
+            if surf is not None:
+                return finalize_scaled(surf)
+        return finalize_scaled(self._scale_and_publish(key, w, h, name))
+
+    def scaled_steps(self, key, w, h):
+        w, h = max(1, int(w)), max(1, int(h))
+        name = self._store_name(key, w, h)
+        if name is not None:
+            surf = self.store.attach(name, (w, h))
+            if surf is not None:
+                return finalize_scaled(surf)
+
+        if self._covers(key, (w, h)):
+            src = self._sources[key]
+        elif key in self._files:
+            src = None
+            future = submit_file(self._files[key], (w, h))
+            if future is not None:
+                while not future.done():
+                    yield
+                src = future_surface(future)
+            if src is None:
+                yield
+                try:
+                    raw = load_image_raw(self._files[key], (w, h))
+                except Exception:
+                    raw = None
+                if raw is not None:
+                    yield
+                    src = convert_source(raw)
+            src = self._keep_source(key, src)
+        else:
+            src = self[key]
+        if src is None:
+            return None
+
+        yield
+        surf = scale(src, w, h)
+        if key in self._trim:
+            yield
+            surf = trim_surface(surf)
+        if name is not None:
+            yield
+            surf = self.store.publish(name, surf)
+        return finalize_scaled(surf)
+
+    def scaled_many(self, requests):
+        # requests: dict naam -> (key, w, h); alles wat niet in de store zit wordt
+        # eerst in één batch (parallel) gedecodeerd en daarna geschaald
+        out = {}
+        todo = {}
+        for out_name, (key, w, h) in requests.items():
+            w, h = max(1, int(w)), max(1, int(h))
+            name = self._store_name(key, w, h)
+            surf = self.store.attach(name, (w, h)) if name is not None else None
+            if surf is not None:
+                out[out_name] = finalize_scaled(surf)
+            else:
+                todo[out_name] = (key, w, h, name)
+
+        targets = {}
+        for key, w, h, _ in todo.values():
+            tw, th = targets.get(key, (0, 0))
+            targets[key] = (max(tw, w), max(th, h))
+        self.preload(targets, targets)
+        for out_name, (key, w, h, name) in todo.items():
+            out[out_name] = finalize_scaled(self._scale_and_publish(key, w, h, name))
+        return out
+
+    # --- rapportage ---
+    def source_bytes(self):
+        return sum(surface_bytes(s) for s in self._sources.values())
+
+    def tracked_bytes(self):
+        return {group: sum(surface_bytes(s) for s in surfaces.values())
+                for group, surfaces in self._tracked.items()}
+
+    def total_bytes(self):
+        return self.source_bytes() + sum(self.tracked_bytes().values())
+
+    def report(self):
+        mb = 1024 * 1024
+        lines = [f"Surfaces: {self.total_bytes() / mb:.1f} MB / budget {self.budget / mb:.0f} MB"]
+        lines.append(f"  sources: {len(self._sources)} loaded, {self.source_bytes() / mb:.1f} MB")
+        for key, surf in self._sources.items():
+            lines.append(f"    {key}: {surf.get_width()}x{surf.get_height()} {surface_bytes(surf) / mb:.1f} MB")
+        for group, n in self.tracked_bytes().items():
+            lines.append(f"  {group}: {n / mb:.1f} MB")
+        lines.append("  decodes={decodes} evictions={evictions} releases={releases}".format(**self.stats))
+        if self.store is not None:
+            lines.append("  shared store: attached={attached} published={published}".format(**self.store.stats))
+        return lines
@@ -0,0 +1,89 @@
+# tasks.py
+# Achtergrondwerk in de tijd die per frame overblijft.
+
+# Een taak is een generator: elke next() is één kort stuk werk (yield = "hier mag je stoppen")
+# TaskScheduler.run() draait na de flip stappen (round-robin) tot TASK_SLACK_MS voor het
+# volgende frame; tussendoor wordt de input gelezen zodat de tijdstempels kloppen (input_timing.py)
+
+# Tijdens PLAY draaien alleen taken met play_ok=True; de rest wacht tot een menu-scene
+# add() met een naam die al in de rij staat vervangt die taak (bv. twee keer opslaan = één keer)
+# finish() maakt taken meteen af (bv. een skin vóór PLAY); drain(*names) bij afsluiten maakt
+# alleen die taken af (opslaan, ...) en annuleert de rest (skin laden, thumbs vooruit decoderen)
+import time
+from config import FPS, TASK_SLACK_MS
+from constants import SCENE_PLAY
+
+def call_steps(fn, *args):
+    # gewone functie als taak van één stap
+    yield
+    fn(*args)
+
+class TaskScheduler:
+    def __init__(self, fps=FPS, slack_ms=TASK_SLACK_MS):
+        self.frame_time = 1.0 / fps
+        self.slack = slack_ms / 1000.0
+        self._tasks = {}   # naam -> (generator, play_ok); volgorde = volgorde van toevoegen
+        self.stats = {"steps": 0, "done": 0, "replaced": 0, "deferred_frames": 0, "errors": 0}
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def pending(self, name=None):
+        if name is None:
+            return list(self._tasks)
+        return name in self._tasks
+
+    def add(self, name, steps, play_ok=False):
+        old = self._tasks.pop(name, None)
+        if old is not None:
+            old[0].close()
+            self.stats["replaced"] += 1
+        self._tasks[name] = (steps, play_ok)
+
+    def cancel(self, name):
+        task = self._tasks.pop(name, None)
+        if task is not None:
+            task[0].close()
+
+    def _step(self, name):
+        steps, play_ok = self._tasks[name]
+        try:
+            next(steps)
+            self.stats["steps"] += 1
+            # achteraan in de rij: de andere taken komen eerst weer aan de beurt
+            self._tasks[name] = self._tasks.pop(name)
+        except StopIteration:
+            self._tasks.pop(name, None)
+            self.stats["done"] += 1
+        except Exception:
+            self._tasks.pop(name, None)
+            self.stats["errors"] += 1
+
+    def run(self, deadline, scene, poll=None):
+        # deadline: perf_counter-tijd van het volgende frame
+        deadline -= self.slack
+        ran = False
+        while self._tasks and time.perf_counter() < deadline:
+            name = next((n for n, (_, play_ok) in self._tasks.items()
+                         if play_ok or scene != SCENE_PLAY), None)
+            if name is None:
+                break
+            self._step(name)
+            ran = True
+            if poll is not None:
+                poll()
+        if self._tasks and not ran:
+            self.stats["deferred_frames"] += 1
+
+    def finish(self, *names):
+        for name in names:
+            while name in self._tasks:
+                self._step(name)
+
+    def drain(self, *names):
+        # zonder names: alles afmaken
+        if names:
+            for name in [n for n in self._tasks if n not in names]:
+                self.cancel(name)
+        while self._tasks:
+            self._step(next(iter(self._tasks)))
@@ -0,0 +1,94 @@
+# thumb_store.py
+# Persistente cache voor shop thumbnails.
+
+# Eén pack-bestand per thumbnail-grootte in CACHE_DIR (thumbs_WxH.pack)
+# Key = sha1 van het item-bestand, dus een aangepaste skin krijgt vanzelf een nieuwe thumb
+
+# ThumbStore laadt het pack in één keer (gecomprimeerd) en decodeert per thumb pas bij get()
+
+# flush() schrijft nieuwe thumbs weg (bij het verlaten van de shop en bij afsluiten)
+import json
+import os
+import struct
+import zlib
+import pygame
+from config import CACHE_DIR
+
+PACK_MAGIC = b"THMB1\n"
+
+class ThumbStore:
+    def __init__(self, thumb_w, thumb_h, cache_dir=CACHE_DIR):
+        self.thumb_w = thumb_w
+        self.thumb_h = thumb_h
+        self.path = os.path.join(cache_dir, f"thumbs_{thumb_w}x{thumb_h}.pack")
+        self._entries = {}   # hash -> (w, h, zlib RGBA bytes)
+        self._dirty = False
+        self._load()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _load(self):
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return
+        try:
+            if not data.startswith(PACK_MAGIC):
+                return
+            pos = len(PACK_MAGIC)
+            (index_len,) = struct.unpack_from(">I", data, pos)
+            pos += 4
+            index = json.loads(data[pos:pos + index_len].decode("utf-8"))
+            pos += index_len
+            blobs = memoryview(data)[pos:]
+            for key, (w, h, offset, length) in index.items():
+                self._entries[key] = (w, h, blobs[offset:offset + length])
+        except Exception:
+            # kapot/oud pack: gewoon opnieuw opbouwen
+            self._entries = {}
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        w, h, blob = entry
+        try:
+            raw = zlib.decompress(blob)
+            return pygame.image.frombuffer(raw, (w, h), "RGBA").convert_alpha()
+        except Exception:
+            del self._entries[key]
+            return None
+
+    def put(self, key, surf):
+        w, h = surf.get_size()
+        raw = pygame.image.tobytes(surf, "RGBA")
+        self._entries[key] = (w, h, zlib.compress(raw, 6))
+        self._dirty = True
+
+    def flush(self):
+        if not self._dirty:
+            return
+        index = {}
+        blobs = []
+        offset = 0
+        for key, (w, h, blob) in self._entries.items():
+            index[key] = (w, h, offset, len(blob))
+            blobs.append(blob)
+            offset += len(blob)
+        index_bytes = json.dumps(index).encode("utf-8")
+
+        tmp = self.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(PACK_MAGIC)
+                f.write(struct.pack(">I", len(index_bytes)))
+                f.write(index_bytes)
+                for blob in blobs:
+                    f.write(blob)
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except Exception:
+            pass
@@ -7,30 +7,85 @@
 
 # tab_button() (shop tabs)
 
-# draw_star_row() tekent de 3 sterren
+# draw_star_row() tekent de 3 sterren, draw_big_star() de grote op het COMPLETE-scherm;
+# beide blitten uit een sterren-atlas (star_sprite() rendert anti-aliased via supersampling)
+# Elke ster wordt één keer gerenderd (_star_sprites); komt er een nieuwe grootte bij, dan wordt
+# de atlas opnieuw gepakt met build_atlas(), die groot genoeg is voor alle sterren
 import math
 import pygame
-from config import BUTTON_BG_COLOR, BUTTON_TEXT_COLOR, COL_BTN_BG, COL_BORDER, COL_TEXT
+from atlas import build_atlas
+from config import BUTTON_BG_COLOR, BUTTON_TEXT_COLOR, COL_BTN_BG, COL_BORDER, COL_TEXT, STAR_SUPERSAMPLE
+
+_star_sprites = {}   # "kind:size:filled" -> gerenderde ster
+_star_atlas = None   # Atlas met alle sterren uit _star_sprites
+
+def _small_star_points(cx, cy, size):
+    return [
+        (cx, cy - size/2),
+        (cx + size*0.18, cy - size*0.15),
+        (cx + size/2, cy - size*0.15),
+        (cx + size*0.26, cy + size*0.05),
+        (cx + size*0.35, cy + size/2),
+        (cx, cy + size*0.22),
+        (cx - size*0.35, cy + size/2),
+        (cx - size*0.26, cy + size*0.05),
+        (cx - size/2, cy - size*0.15),
+        (cx - size*0.18, cy - size*0.15),
+    ]
+
+def _big_star_points(cx, cy, size):
+    pts = []
+    for i in range(10):
+        r = size if i % 2 == 0 else size * 0.45
+        ang = math.radians(i * 36)
+        pts.append((cx + r * math.sin(ang), cy - r * math.cos(ang)))
+    return pts
+
+def star_sprite(kind, size, filled):
+    # Renderen op STAR_SUPERSAMPLE x de grootte en smooth verkleinen (= anti-aliasing)
+    ss = STAR_SUPERSAMPLE
+    if kind == "small":
+        color = (240, 200, 60) if filled else (170, 170, 180)
+        outline = (110, 110, 120)
+        extent = size
+        points = _small_star_points
+    else:
+        color = (253, 221, 131) if filled else (80, 80, 80)
+        outline = (20, 20, 20)
+        extent = size * 2
+        points = _big_star_points
+    side = int(extent) + 4   # ruimte voor de rand
+    big = pygame.Surface((side * ss, side * ss), pygame.SRCALPHA)
+    pts = points(side * ss / 2, side * ss / 2, size * ss)
+    pygame.draw.polygon(big, color, pts)
+    pygame.draw.polygon(big, outline, pts, 2 * ss)
+    return pygame.transform.smoothscale(big, (side, side)).convert_alpha()
+
+def star_atlas(kind, size):
+    # Gevulde + lege ster van deze grootte worden één keer gerenderd en samen in de
+    # sterren-atlas gezet; geeft (atlas, {gevuld: naam}) terug
+    global _star_atlas
+    names = {filled: f"{kind}:{size}:{int(filled)}" for filled in (True, False)}
+    if _star_atlas is None or any(name not in _star_atlas for name in names.values()):
+        for filled, name in names.items():
+            if name not in _star_sprites:
+                _star_sprites[name] = star_sprite(kind, size, filled)
+        _star_atlas = build_atlas(_star_sprites)
+    return _star_atlas, names
+
+def _star_pos(atlas, name, cx, cy):
+    rect = atlas.rect(name)
+    return (int(cx) - rect.w // 2, int(cy) - rect.h // 2)
 
 def draw_star_row(screen, x, y, n, size=18, gap=8):
+    atlas, names = star_atlas("small", size)
+    items = []
     for i in range(3):
         cx = x + i*(size+gap) + size//2
         cy = y + size//2
-        color = (240, 200, 60) if i < n else (170, 170, 180)
-        pts = [
-            (cx, cy - size//2),
-            (cx + size*0.18, cy - size*0.15),
-            (cx + size//2, cy - size*0.15),
-            (cx + size*0.26, cy + size*0.05),
-            (cx + size*0.35, cy + size//2),
-            (cx, cy + size*0.22),
-            (cx - size*0.35, cy + size//2),
-            (cx - size*0.26, cy + size*0.05),
-            (cx - size//2, cy - size*0.15),
-            (cx - size*0.18, cy - size*0.15),
-        ]
-        pygame.draw.polygon(screen, color, pts)
-        pygame.draw.polygon(screen, (110, 110, 120), pts, 2)
+        name = names[i < n]
+        items.append((name, _star_pos(atlas, name, cx, cy)))
+    atlas.blits(screen, items)
 
 def button(screen, font, rect, text, enabled=True):
     mx, my = pygame.mouse.get_pos()
@@ -87,15 +142,16 @@ def tab_button(screen, font, rect, text, active, COL_BORDER, COL_TEXT):
 def draw_panel(screen, rect, fill=(15, 15, 18, 180), border=(253, 221, 131), radius=20, shadow=12):
     x, y, w, h = rect
 
-    # Shadow
-    shadow_surf = pygame.Surface((w + shadow*2, h + shadow*2), pygame.SRCALPHA)
-    pygame.draw.rect(
-        shadow_surf,
-        (0, 0, 0, 140),
-        (shadow, shadow, w, h),
-        border_radius=radius
-    )
-    screen.blit(shadow_surf, (x - shadow//2, y - shadow//2))
+    # Shadow (shadow=0: overslaan, bv. op lagere kwaliteit)
+    if shadow > 0:
+        shadow_surf = pygame.Surface((w + shadow*2, h + shadow*2), pygame.SRCALPHA)
+        pygame.draw.rect(
+            shadow_surf,
+            (0, 0, 0, 140),
+            (shadow, shadow, w, h),
+            border_radius=radius
+        )
+        screen.blit(shadow_surf, (x - shadow//2, y - shadow//2))
 
     # Panel
     panel = pygame.Surface((w, h), pygame.SRCALPHA)
@@ -108,14 +164,5 @@ def draw_text_shadow(screen, font_obj, text, x, y, color=(255, 255, 255), shadow
     screen.blit(font_obj.render(text, True, color), (x, y))
 
 def draw_big_star(screen, cx, cy, size, filled=True):
-    pts = []
-    for i in range(10):
-        r = size if i % 2 == 0 else size * 0.45
-        ang = math.radians(i * 36)
-        x = cx + r * math.sin(ang)
-        y = cy - r * math.cos(ang)
-        pts.append((x, y))
-
-    color = (253, 221, 131) if filled else (80, 80, 80)
-    pygame.draw.polygon(screen, color, pts)
-    pygame.draw.polygon(screen, (20, 20, 20), pts, 2)
+    atlas, names = star_atlas("big", int(size))
+    atlas.blit(screen, names[filled], _star_pos(atlas, names[filled], cx, cy))
@@ -2,23 +2,104 @@
 # Kleine herbruikbare helper-functies.
 
 # load_image() laadt assets uit de assets-map
+# (load_image_raw() decodeert zonder convert, werkt ook zonder display, bv. in decode_pool;
+# een geldig build-bestand uit asset_build.py gaat voor op de PNG)
 
-# scale() schaalt surfaces
+# surface_from_rgba() maakt van ruwe RGBA bytes weer een display-klare Surface
 
-# draw_text(), clamp(), blit_fit_center() (voor thumbnails in shop)
+# convert_source() / finalize_scaled() kiezen per surface het snelste formaat: opaak zonder
+# alpha-blending, binaire alpha als colorkey (RLE), alleen echte doorzichtigheid per-pixel alpha
 
+# scale() schaalt surfaces (smooth=False: snellere nearest-neighbour); een TrimmedSurface
+# blijft getrimd, w/h gelden dan voor de volledige sprite
+
+# draw_text(), clamp(), fit_image() + blit_fit_center() (voor thumbnails in shop)
+
+# file_hash() geeft de sha1 van een bestand (onthouden per size/mtime in CACHE_DIR)
+
+import hashlib
+import json
 import os
 import pygame
-from config import ASSETS_DIR
+from config import ASSETS_DIR, CACHE_DIR
+from asset_build import built_surface
+from sprites import TrimmedSurface, scale_trimmed
 
-def load_image(filename: str) -> pygame.Surface:
+HASH_INDEX_PATH = os.path.join(CACHE_DIR, "file_hashes.json")
+COLORKEY_CANDIDATES = ((255, 0, 255), (0, 255, 255), (1, 2, 3))
+ALPHA_MARGIN = 6
+_hash_index = None
+
+def load_image_raw(filename: str, target=None) -> pygame.Surface:
+    # target (w, h): de grootte waarnaar geschaald gaat worden; dan mag een kleinere build-variant
     path = os.path.join(ASSETS_DIR, filename)
     if not os.path.exists(path):
         raise FileNotFoundError(f"Asset ontbreekt: {path}")
-    return pygame.image.load(path).convert_alpha()
+    built = built_surface(filename, target)
+    if built is not None:
+        return built
+    return pygame.image.load(path)
+
+def load_image(filename: str, target=None) -> pygame.Surface:
+    return convert_source(load_image_raw(filename, target))
+
+def surface_from_rgba(size, data) -> pygame.Surface:
+    return convert_source(pygame.image.frombuffer(data, size, "RGBA"))
+
+def alpha_kind(surf) -> str:
+    # "opaque" (alles ~255), "binary" (alleen ~0 of ~255) of "translucent"; smoothscale maakt
+    # van 255 soms 253, vandaar de marge (ALPHA_MARGIN)
+    if not surf.get_flags() & pygame.SRCALPHA:
+        return "opaque"
+    w, h = surf.get_size()
+    opaque = pygame.mask.from_surface(surf, 255 - ALPHA_MARGIN).count()
+    if opaque == w * h:
+        return "opaque"
+    visible = pygame.mask.from_surface(surf, ALPHA_MARGIN).count()
+    return "binary" if visible == opaque else "translucent"
+
+def convert_source(surf) -> pygame.Surface:
+    # bronnen worden nog (smooth)geschaald, dus geen colorkey: alleen opaak -> convert()
+    if alpha_kind(surf) == "opaque":
+        return surf.convert()
+    return surf.convert_alpha()
+
+def colorkey_surface(surf):
+    # binaire alpha -> opake surface met colorkey + RLE; None als er geen vrije key-kleur is
+    for key in COLORKEY_CANDIDATES:
+        if pygame.mask.from_threshold(surf, key + (255,), (1, 1, 1, 255)).count() == 0:
+            break
+    else:
+        return None
+    # niet gewoon blitten: alpha 1..ALPHA_MARGIN en 250..254 zouden met de key-kleur mengen;
+    # zichtbare pixels worden dus eerst volledig opaak gemaakt en via het mask gekopieerd
+    solid = surf.copy()
+    solid.fill((0, 0, 0, 255), special_flags=pygame.BLEND_RGBA_MAX)
+    solid = solid.convert()
+    out = pygame.Surface(surf.get_size()).convert()
+    pygame.mask.from_surface(surf, ALPHA_MARGIN).to_surface(out, setsurface=solid, unsetcolor=key)
+    out.set_colorkey(key, pygame.RLEACCEL)
+    return out
 
-def scale(img, w, h):
-    return pygame.transform.smoothscale(img, (int(w), int(h)))
+def finalize_scaled(surf):
+    # na het schalen (wordt niet meer geschaald): opaak -> alpha-blending uit (in place, zodat
+    # een gedeelde mmap-surface gedeeld blijft); binair -> colorkey/RLE; de rest houdt per-pixel alpha
+    if surf is None or not surf.get_flags() & pygame.SRCALPHA:
+        return surf
+    kind = alpha_kind(surf)
+    if kind == "opaque":
+        surf.set_alpha(None)
+    elif kind == "binary" and not isinstance(surf, TrimmedSurface):
+        return colorkey_surface(surf) or surf
+    return surf
+
+def scale(img, w, h, smooth=True):
+    # colorkey-surfaces niet smooth schalen: de key-kleur zou in de randen meegemengd worden
+    smooth = smooth and img.get_colorkey() is None
+    scaler = pygame.transform.smoothscale if smooth else pygame.transform.scale
+    if isinstance(img, TrimmedSurface):
+        return scale_trimmed(img, int(w), int(h), scaler)
+    return scaler(img, (int(w), int(h)))
 
 def draw_text(surf, font_obj, text, x, y, color=(20, 20, 25)):
     surf.blit(font_obj.render(text, True, color), (x, y))
@@ -26,14 +107,52 @@ def draw_text(surf, font_obj, text, x, y, color=(20, 20, 25)):
 def clamp(v, a, b):
     return max(a, min(b, v))
 
-def blit_fit_center(surf, img, rect, padding=8):
-    max_w = max(1, rect.w - 2*padding)
-    max_h = max(1, rect.h - 2*padding)
+def fit_image(img, max_w, max_h):
+    # schaalt img zo groot mogelijk binnen max_w x max_h (aspect ratio blijft)
+    max_w, max_h = max(1, int(max_w)), max(1, int(max_h))
     iw, ih = img.get_width(), img.get_height()
     if iw <= 0 or ih <= 0:
-        return
+        return None
     s = min(max_w / iw, max_h / ih)
     w, h = max(1, int(iw * s)), max(1, int(ih * s))
-    scaled = pygame.transform.smoothscale(img, (w, h))
+    return pygame.transform.smoothscale(img, (w, h))
+
+def blit_fit_center(surf, img, rect, padding=8):
+    scaled = fit_image(img, rect.w - 2*padding, rect.h - 2*padding)
+    if scaled is None:
+        return
     dst = scaled.get_rect(center=rect.center)
     surf.blit(scaled, dst)
+
+def _load_hash_index():
+    global _hash_index
+    if _hash_index is None:
+        try:
+            with open(HASH_INDEX_PATH, "r", encoding="utf-8") as f:
+                _hash_index = json.load(f)
+        except Exception:
+            _hash_index = {}
+    return _hash_index
+
+def file_hash(path: str) -> str:
+    # Een skin-bestand helemaal inlezen om te hashen is duur, dus de hash wordt
+    # bewaard zolang size + mtime van het bestand gelijk blijven.
+    st = os.stat(path)
+    index = _load_hash_index()
+    key = os.path.abspath(path)
+    rec = index.get(key)
+    if rec and rec["size"] == st.st_size and rec["mtime_ns"] == st.st_mtime_ns:
+        return rec["sha1"]
+
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    index[key] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha1": h.hexdigest()}
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(HASH_INDEX_PATH, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+    except Exception:
+        pass
+    return index[key]["sha1"]